@@ -0,0 +1,61 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Tests the benchmark helpers."""
+
+import json
+import subprocess
+import sys
+
+import numpy as np
+
+from typical.bench import _bounds, _measure, _traces, _values, imports
+from typical.numeric import finite
+
+#####################################################################
+# IMPORT TIME
+#####################################################################
+
+def test_imports_are_lazy():
+    __record = imports(repeat=1)
+
+    assert not __record['numpy']
+    assert not __record['sympy']
+    assert __record['seconds'] > 0.
+
+def test_lazy_bindings_match_the_eager_imports():
+    __script = '; '.join([
+        'import typical',
+        'import typical.iterable as m',
+        'import typical.numeric',
+        'print(type(m).__name__, type(typical.numeric).__name__, type(typical.symbolic).__name__)'])
+    __output = subprocess.run(
+        [sys.executable, '-c', __script],
+        capture_output=True,
+        text=True,
+        check=True).stdout
+
+    assert __output.split() == ['module', 'function', 'function']
+
+#####################################################################
+# PREDICATES
+#####################################################################
+
+def test_inputs():
+    for __inputs in (_values, _bounds, _traces):
+        for __kind, __x in __inputs(10).items():
+            assert len(__x) in (3, 10)
+
+    assert all(__l <= __u for __l, __u in _bounds(100)['list'])
+
+def test_measure():
+    __record = _measure(finite, np.arange(10))
+
+    assert __record['result']
+    assert 0. < __record['seconds'] < 1.
+
+    def __failing(x):
+        raise ValueError(x)
+
+    assert 'error' in _measure(__failing, 1)
+    assert json.dumps(__record)
@@ -21,6 +21,7 @@ from typical.iterable import scalar
 from typical.numeric import finite, numeric
 from typical.optimization import bounds, specifications
 from typical.symbolic import symbolic
+from typical.typical import checks
 
 #####################################################################
 # GENERIC PREDICATES
@@ -203,3 +204,37 @@ def test_iterable():
 
     for x in ok:
         assert iterable(x)
+
+def test_iterable_arrays_are_not_cached():
+    @checks
+    def size(x: iterable):
+        return np.size(x)
+
+    assert size(np.array([1.])) == 1
+
+    with pytest.raises(TypeError):
+        size(np.array(1.))
+
+def test_combinators_short_circuit():
+    __calls = []
+
+    def __spy(x):
+        __calls.append(x)
+        return True
+
+    assert one_of(int, __spy)(3)
+    assert one_of(anything, __spy)(3)
+    assert not all_of(str, __spy)(3)
+    assert not __calls
+
+    assert one_of(str, __spy)(3)
+    assert __calls == [3]
+
+def test_combinators_flatten():
+    assert one_of(one_of(int, str), one_of(float))._one_of == (int, str, float)
+    assert all_of(all_of(int, numeric), finite)._all_of == (int, numeric, finite)
+
+    assert one_of(one_of(int, str), float)('a')
+    assert not one_of(one_of(int, str), float)(None)
+    assert all_of(all_of(int, numeric), finite)(3)
+    assert not all_of(all_of(int, numeric), finite)(3.)
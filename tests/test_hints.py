@@ -0,0 +1,121 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Tests the compilation of the type hints."""
+
+import collections.abc
+import numbers
+import random
+import sys
+import typing
+
+import pytest
+
+from typical.hints import compile_hint, is_hint
+from typical.typical import checks
+
+#####################################################################
+# COMPILATION
+#####################################################################
+
+def test_hints_are_told_from_predicates():
+    assert is_hint(typing.List[int])
+    assert is_hint(dict[str, float])
+    assert is_hint(typing.Any)
+    assert is_hint(typing.NewType('UserId', int))
+    assert is_hint(numbers.Real)
+    assert not is_hint(int)
+    assert not is_hint(callable)
+
+def test_unions_of_classes_are_inlined():
+    assert compile_hint(typing.Optional[int])._isinstance == (int, type(None))
+    assert compile_hint(typing.Union[int, str])._isinstance == (int, str)
+    assert compile_hint(typing.Union[int, typing.Any]) is None
+
+def test_hints_on_valid_and_invalid_values():
+    bullshit = [
+        (typing.List[int], [1, 'a']),
+        (list[int], (1, 2)),
+        (typing.Dict[str, float], {'a': 1.5, 2: 3.}),
+        (dict[str, list[int]], {'a': [1, None]}),
+        (typing.Optional[float], 'a'),
+        (typing.Tuple[int, str], (1, 2)),
+        (typing.Tuple[int, str], (1, 'a', 2)),
+        (tuple[int, ...], (1, 2.)),
+        (typing.Literal['a', 1], True),
+        (typing.Type[numbers.Number], str),
+        (collections.abc.Sequence[int], {1, 2}),
+        (None, 0)]
+
+    ok = [
+        (typing.List[int], [1, 2]),
+        (list[int], []),
+        (typing.Dict[str, float], {'a': 1.5}),
+        (dict[str, list[int]], {'a': [1, 2]}),
+        (typing.Optional[float], None),
+        (typing.Tuple[int, str], (1, 'a')),
+        (tuple[int, ...], (1, 2, 3)),
+        (typing.Literal['a', 1], 1),
+        (typing.Type[numbers.Number], int),
+        (collections.abc.Sequence[int], range(3)),
+        (typing.Iterator[int], iter('abc')),
+        (typing.Annotated[int, 'positive'], 3),
+        (typing.NewType('UserId', int), 3),
+        (None, None)]
+
+    for __hint, __x in bullshit:
+        assert not compile_hint(__hint)(__x)
+
+    for __hint, __x in ok:
+        assert compile_hint(__hint)(__x)
+
+#####################################################################
+# DEPTH & SAMPLING
+#####################################################################
+
+def test_depth_limits_the_nested_checks():
+    __nested = [[1, 'a']]
+
+    assert not compile_hint(list[list[int]], depth=2)(__nested)
+    assert compile_hint(list[list[int]], depth=1)(__nested)
+    assert compile_hint(list[list[int]], depth=0)([None])
+
+def test_elements_are_sampled():
+    __values = list(range(1000)) + ['a']
+
+    assert compile_hint(list[int], elements=1)(__values[:10])
+    assert not compile_hint(list[int], elements=None)(__values)
+    assert not compile_hint(list[int], elements=1)(['a'])
+    assert not all(compile_hint(list[int], elements=32)(__values) for __i in range(1000))
+
+def test_sampling_leaves_the_global_random_state_alone():
+    __check = compile_hint(list[int], elements=1)
+
+    random.seed(0)
+    __expected = random.random()
+    random.seed(0)
+    __check(list(range(10)))
+
+    assert random.random() == __expected
+
+@pytest.mark.skipif(sys.version_info < (3, 10), reason='PEP 604 unions need python 3.10')
+def test_pep_604_unions():
+    assert is_hint(eval('int | None'))
+    assert compile_hint(eval('int | str'))._isinstance == (int, str)
+
+#####################################################################
+# DECORATOR
+#####################################################################
+
+def test_checks_on_type_hints():
+    @checks(elements=None)
+    def total(x: typing.List[int], scale: typing.Optional[float] = None) -> int:
+        return sum(x) * int(scale or 1)
+
+    assert total([1, 2], 2.) == 6
+
+    with pytest.raises(TypeError):
+        total([1, 2.5])
+
+    with pytest.raises(TypeError):
+        total([1], scale='2')
@@ -9,7 +9,7 @@ import numpy as np
 import pytest
 from numpy.testing import assert_allclose
 
-from typical.iterable import scalar
+from typical.iterable import array, scalar
 
 #####################################################################
 # MATRIX & ARRAY PREDICATES
@@ -40,3 +40,32 @@ def test_scalar_predicate_on_single_element_iterables():
     assert all(map(
         scalar,
         ok_scalar))
+
+#####################################################################
+# ARRAY SPECIFICATIONS
+#####################################################################
+
+def test_array_predicate():
+    __matrix = np.zeros((3, 4), dtype=np.float32)
+
+    bullshit = [
+        (array(), [1., 2.]),
+        (array(dtype=np.float64), __matrix),
+        (array(dtype=np.integer), __matrix),
+        (array(shape=(3,)), __matrix),
+        (array(shape=(3, 5)), __matrix),
+        (array(shape=('n', 'n')), __matrix)]
+
+    ok = [
+        (array(), __matrix),
+        (array(dtype='float32'), __matrix),
+        (array(dtype=np.floating), __matrix),
+        (array(shape=(3, None)), __matrix),
+        (array(shape=('n', 'd')), __matrix),
+        (array(dtype=float, shape=('n', 'n')), np.eye(2))]
+
+    for __predicate, __x in bullshit:
+        assert not __predicate(__x)
+
+    for __predicate, __x in ok:
+        assert __predicate(__x)
@@ -3,13 +3,15 @@
 
 """Tests the type checking predicates."""
 
+import decimal
+import fractions
 import math
 import numpy as np
 
 import pytest
 from numpy.testing import assert_allclose
 
-from typical.numeric import finite, numeric
+from typical.numeric import _numeric_scalar, find_nonfinite, find_nonnumeric, finite, numeric
 
 #####################################################################
 # NUMERIC PREDICATES
@@ -35,6 +37,27 @@ def test_numeric_on_scalars():
     for x in ok:
         assert numeric(x)
 
+def test_numeric_scalar_dispatch():
+    bullshit = [
+        '1e5',
+        b'3',
+        1 + 2j,
+        np.complex64(1),
+        np.str_('2.5')]
+
+    ok = [
+        fractions.Fraction(1, 3),
+        decimal.Decimal('1.5'),
+        np.float16(2),
+        np.uint8(7),
+        np.array(4.5)]
+
+    for x in bullshit:
+        assert not _numeric_scalar(x)
+
+    for x in ok:
+        assert _numeric_scalar(x)
+
 def test_numeric_on_iterables():
     bullshit = [
         'kgjdqlsfj',
@@ -94,3 +117,75 @@ def test_finite_on_iterables():
 
     for x in ok:
         assert finite(x)
+
+def test_numeric_on_arrays():
+    bullshit = [
+        np.array(['a', 'b']),
+        np.array([1.5, None], dtype=object),
+        np.array([1 + 2j]),
+        np.array(['1.5', '3'])]
+
+    ok = [
+        np.zeros(0, dtype=complex),
+        np.array([True, False]),
+        np.arange(12, dtype=np.uint8),
+        np.full((3, 4), np.nan),
+        np.array([1.5, 3], dtype=object)]
+
+    for x in bullshit:
+        assert not numeric(x)
+
+    for x in ok:
+        assert numeric(x)
+
+def test_finite_on_arrays():
+    bullshit = [
+        np.array(['a', 'b']),
+        np.array([1.5, None], dtype=object),
+        np.array([1.5, np.inf], dtype=object),
+        np.array([[0., 1.], [np.nan, 2.]]),
+        np.array([1 + 2j, np.inf])]
+
+    ok = [
+        np.zeros(0),
+        np.array([True, False]),
+        np.arange(12, dtype=np.int64).reshape(3, 4),
+        np.array([1 + 2j]),
+        np.array([1.5, 3], dtype=object)]
+
+    for x in bullshit:
+        assert not finite(x)
+
+    for x in ok:
+        assert finite(x)
+
+#####################################################################
+# CHUNKED SCANS
+#####################################################################
+
+def test_find_nonfinite_in_files(tmp_path):
+    __path = tmp_path / 'data.npy'
+    __data = np.arange(1000, dtype=np.float64).reshape(100, 10)
+    __data[37, 4] = np.nan
+    __data[80, 0] = np.inf
+    np.save(__path, __data)
+
+    assert find_nonfinite(__path, chunk_size=64) == (37, 4)
+    assert find_nonfinite(str(__path), chunk_size=7) == (37, 4)
+
+    __mapped = np.load(__path, mmap_mode='r')
+    assert not finite(__mapped)
+    assert find_nonfinite(__mapped[:30]) is None
+    assert finite(__mapped[:30])
+
+def test_find_nonfinite_on_arrays():
+    assert find_nonfinite(np.zeros(0)) is None
+    assert find_nonfinite(np.float64(np.nan) * np.ones(())) == ()
+    assert find_nonfinite(np.array([1., 2., -np.inf]), chunk_size=1) == (2,)
+    assert find_nonfinite(np.array([1, 'a', 3], dtype=object)) == (1,)
+
+def test_find_nonnumeric():
+    assert find_nonnumeric(np.arange(10)) is None
+    assert find_nonnumeric(np.array([1j])) == (0,)
+    assert find_nonnumeric(np.array([1, 2.5, 'x', 'y'], dtype=object), chunk_size=2) == (2,)
+    assert find_nonnumeric(np.array(['1', '2.5'])) == (0,)
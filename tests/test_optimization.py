@@ -9,7 +9,11 @@ import numpy as np
 import pytest
 from numpy.testing import assert_allclose
 
-from typical.optimization import bounds, specifications
+from typical.optimization import (
+    bounds,
+    find_invalid_bounds,
+    parse_specifications,
+    specifications)
 
 #####################################################################
 # BOUNDS PREDICATES
@@ -74,6 +78,8 @@ def test_specifications_predicate_on_bullshit():
         (43, -2),
         {},
         {'tr': 'àdfsg', (4, 5): (4.5, 9)},
+        {'a': ('1', '2')},
+        {'a': (1, 2), 'b': (b'1', 2)},
         np.arange(12).reshape(3, 4)]
 
     for x in bullshit:
@@ -87,3 +93,50 @@ def test_specifications_predicate_on_dicts():
 
     for x in dicts:
         assert specifications(x)
+
+def test_bounds_predicate_on_large_arrays():
+    __data = np.random.default_rng(0).random((10 ** 5, 2))
+    __data.sort(axis=1)
+
+    assert bounds(__data)
+    assert bounds(__data.astype(np.float32))
+    assert bounds(np.zeros((0, 2)))
+
+    __data[[12, 345], 0] = 2.
+    __data[678, 1] = np.nan
+
+    assert not bounds(__data)
+    assert list(find_invalid_bounds(__data)) == [12, 345, 678]
+
+def test_bounds_predicate_on_object_arrays():
+    assert bounds(np.array([[1, 2.5], [3, 3]], dtype=object))
+    assert not bounds(np.array([[1, None], [3, 3]], dtype=object))
+    assert list(find_invalid_bounds(np.array([[1, 2], [3, 'a']], dtype=object))) == [1]
+
+    with pytest.raises(ValueError):
+        find_invalid_bounds(np.arange(3))
+
+def test_parse_specifications():
+    __spec = {'a': (-2, 345), 1: (-1, -1), 'z': (9, 9.3)}
+    __parsed = parse_specifications(__spec)
+
+    assert __parsed.names == ('a', 1, 'z')
+    assert_allclose(__parsed.lower, [-2, -1, 9])
+    assert_allclose(__parsed.upper, [345, -1, 9.3])
+    assert not __parsed.lower.flags.writeable
+
+    assert parse_specifications(__spec) is __parsed
+    assert parse_specifications(__parsed) is __parsed
+    assert specifications(__parsed)
+
+    __spec['z'] = (9, np.inf)
+
+    with pytest.raises(ValueError):
+        parse_specifications(__spec)
+
+    __spec['z'] = (9, 10)
+
+    assert_allclose(parse_specifications(__spec).upper, [345, -1, 10])
+
+    with pytest.raises(ValueError):
+        parse_specifications({})
@@ -0,0 +1,93 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Tests the parallel reductions."""
+
+import sys
+import threading
+
+import numpy as np
+
+import pytest
+
+from typical.numeric import finite
+from typical.optimization import bounds
+from typical.parallel import _parse_threshold, all_slices, parallel, parallelize
+
+#####################################################################
+# REDUCTIONS
+#####################################################################
+
+@pytest.fixture
+def threads():
+    parallelize(threshold=100, workers=4)
+    yield
+    parallelize(threshold=None)
+
+def test_parallel_threshold(threads):
+    assert parallel(100)
+    assert not parallel(99)
+
+    parallelize(threshold=None)
+    assert not parallel(10 ** 9)
+
+def test_parallel_threshold_parsing():
+    assert _parse_threshold(' 1024 ') == 1024
+    assert _parse_threshold('') is None
+    assert _parse_threshold('0') is None
+    assert _parse_threshold('-5') is None
+    assert _parse_threshold('4M') is None
+
+def test_all_slices(threads):
+    __calls = []
+
+    def __positive(x):
+        __calls.append(len(x))
+        return (x > 0).all()
+
+    assert all_slices(np.arange(1, 1001), __positive)
+    assert sum(__calls) == 1000
+
+    assert not all_slices(np.arange(-1, 999), __positive)
+    assert all_slices(np.arange(1, 3), __positive)
+
+def test_parallel_predicates(threads):
+    __data = np.random.default_rng(0).random((300, 2))
+    __data.sort(axis=1)
+
+    assert finite(__data)
+    assert finite(__data.T)
+    assert bounds(__data)
+
+    __data[123, 1] = np.nan
+
+    assert not finite(__data)
+    assert not finite(__data[1::2][61:])
+    assert not bounds(__data)
+
+def test_pool_resized_while_in_use(threads):
+    __data = np.ones(1000)
+    __errors = []
+
+    def __check():
+        try:
+            for __i in range(200):
+                assert finite(__data)
+        except Exception as __error:
+            __errors.append(__error)
+
+    __interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+
+    try:
+        __threads = [threading.Thread(target=__check) for __i in range(4)]
+        for __thread in __threads:
+            __thread.start()
+        for __i in range(200):
+            parallelize(threshold=100, workers=2 + __i % 3)
+        for __thread in __threads:
+            __thread.join()
+    finally:
+        sys.setswitchinterval(__interval)
+
+    assert not __errors
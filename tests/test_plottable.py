@@ -3,6 +3,7 @@
 
 """Tests the type checking predicates."""
 
+import array
 import math
 import numpy as np
 
@@ -44,3 +45,18 @@ def test_trace_data_predicate_on_dicts():
 
     for x in dicts:
         assert trace_data(x)
+
+def test_trace_data_predicate_on_arrays():
+    __points = np.random.default_rng(0).random((2, 10 ** 6))
+
+    assert trace_data({'x': __points[0], 'y': __points[1], 'name': 'array'})
+    assert trace_data({'x': array.array('d', [1., 2.]), 'y': memoryview(b'ab'), 'name': 'buffers'})
+    assert trace_data({'x': np.arange(3), 'y': [1, 2., np.float32(3)], 'name': 'mixed'})
+
+    __points[1, 1234] = np.nan
+
+    assert not trace_data({'x': __points[0], 'y': __points[1], 'name': 'nan'})
+    assert not trace_data({'x': __points[0], 'y': __points[1, :-1], 'name': 'sizes'})
+    assert not trace_data({'x': np.zeros(0), 'y': np.zeros(0), 'name': 'empty'})
+    assert not trace_data({'x': np.array(['a']), 'y': [1], 'name': 'strings'})
+    assert not trace_data({'x': np.array(1.), 'y': np.array(2.), 'name': 'scalars'})
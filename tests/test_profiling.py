@@ -0,0 +1,87 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Tests the profiling of the checks."""
+
+import threading
+
+import pytest
+
+from typical.profiling import _COUNTERS, reset_stats, stats
+from typical.typical import checks, profile
+
+#####################################################################
+# COUNTERS
+#####################################################################
+
+@pytest.fixture
+def profiling():
+    profile(True)
+    reset_stats()
+    yield
+    profile(False)
+
+def test_profile_records_the_calls(profiling):
+    @checks
+    def profiled_double(x: int) -> int:
+        return 2 * x
+
+    for __i in range(10):
+        profiled_double(__i)
+
+    with pytest.raises(TypeError):
+        profiled_double(1.5)
+
+    __stats = stats()[__name__ + '.' + profiled_double.__qualname__]
+
+    assert __stats['calls'] == 11
+    assert __stats['failures'] == {'x': 1}
+    assert all(__stats[__k] > 0. for __k in ('arguments', 'body', 'result'))
+
+    reset_stats()
+    __stats = stats()[__name__ + '.' + profiled_double.__qualname__]
+
+    assert __stats['calls'] == 0
+    assert not __stats['failures']
+
+def test_profile_across_threads(profiling):
+    @checks(fail_fast=False)
+    def profiled_half(x: int) -> int:
+        return x // 2
+
+    def __call():
+        for __i in range(100):
+            profiled_half(__i)
+
+    __threads = [threading.Thread(target=__call) for __i in range(4)]
+    for __thread in __threads:
+        __thread.start()
+    for __thread in __threads:
+        __thread.join()
+
+    assert stats()[__name__ + '.' + profiled_half.__qualname__]['calls'] == 400
+
+def test_profile_folds_the_finished_threads(profiling):
+    @checks
+    def profiled_triple(x: int) -> int:
+        return 3 * x
+
+    for __i in range(50):
+        __thread = threading.Thread(target=profiled_triple, args=(__i,))
+        __thread.start()
+        __thread.join()
+
+    __name = __name__ + '.' + profiled_triple.__qualname__
+
+    assert len(_COUNTERS[__name][1]) <= 1
+    assert stats()[__name]['calls'] == 50
+    assert not _COUNTERS[__name][1]
+
+def test_profile_is_opt_in():
+    @checks
+    def unprofiled(x: int) -> int:
+        return x
+
+    unprofiled(1)
+
+    assert __name__ + '.' + unprofiled.__qualname__ not in stats()
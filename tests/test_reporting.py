@@ -0,0 +1,168 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Tests the reporting policies."""
+
+import logging
+import os
+import warnings
+
+import numpy as np
+
+import pytest
+
+import typical.typical
+from typical.iterable import array
+from typical.reporting import TypeWarning, on_failure
+from typical.typical import checks, type_only
+
+#####################################################################
+# FIXTURES
+#####################################################################
+
+@pytest.fixture
+def policy():
+    yield on_failure
+    on_failure()
+
+#####################################################################
+# POLICIES
+#####################################################################
+
+def test_failures_raise_by_default(policy):
+    @checks
+    def double(x: int) -> int:
+        return 2 * x
+
+    with pytest.raises(TypeError):
+        double(1.5)
+
+    policy('warn')
+    policy('raise')
+
+    with pytest.raises(TypeError):
+        double(1.5)
+
+    with pytest.raises(ValueError):
+        policy('ignore')
+
+def test_failures_are_warned(policy):
+    @checks
+    def double(x: int) -> int:
+        return 2 * x
+
+    policy('warn')
+
+    with pytest.warns(TypeWarning) as __warnings:
+        assert double(1.5) == 3.
+
+    assert len(__warnings) == 2
+    assert __warnings[0].filename == __file__
+
+def test_warnings_skip_only_the_package_frames(policy):
+    @checks
+    def double(x: int):
+        return 2 * x
+
+    policy('warn')
+
+    __sibling = os.path.join(
+        os.path.dirname(os.path.dirname(typical.typical.__file__)),
+        'typical_utils',
+        'calls.py')
+
+    with pytest.warns(TypeWarning) as __warnings:
+        exec(compile('double(1.5)', __sibling, 'exec'), {'double': double})
+
+    assert __warnings[0].filename == __sibling
+
+def test_failures_are_logged(policy, caplog):
+    @checks
+    def double(x: int) -> int:
+        return 2 * x
+
+    policy('log')
+
+    with caplog.at_level(logging.WARNING, logger='typical'):
+        assert double('a') == 'aa'
+
+    assert len(caplog.records) == 2
+    assert "'double' accepts" in caplog.records[0].getMessage()
+
+#####################################################################
+# DEDUPLICATION & RATE LIMIT
+#####################################################################
+
+def test_reports_are_deduplicated(policy, caplog):
+    @checks
+    def double(x: int):
+        return 2 * x
+
+    policy('log', rate=None)
+
+    with caplog.at_level(logging.WARNING, logger='typical'):
+        for __x in (1.5, 2.5, 'a', 'b', 3.5):
+            double(__x)
+
+    assert len(caplog.records) == 2
+
+def test_reports_are_rate_limited(policy, caplog):
+    @checks
+    def identity(x: int):
+        return x
+
+    policy('log', rate=1e-3, burst=3)
+
+    with caplog.at_level(logging.WARNING, logger='typical'):
+        for __x in (1.5, 'a', b'b', None, [], ()):
+            identity(__x)
+
+    assert len(caplog.records) == 3
+
+def test_messages_are_formatted_lazily(policy, monkeypatch):
+    __formatted = []
+    __format = typical.typical.function_arg_types_error
+
+    def __counting_format(*args):
+        __formatted.append(args)
+        return __format(*args)
+
+    monkeypatch.setattr(typical.typical, 'function_arg_types_error', __counting_format)
+
+    @checks
+    def double(x: int):
+        return 2 * x
+
+    policy('log', rate=None)
+
+    for __i in range(100):
+        double(1.5)
+
+    assert len(__formatted) == 1
+
+#####################################################################
+# CHECKED FUNCTIONS
+#####################################################################
+
+def test_warned_calls_run_to_the_end(policy):
+    @type_only(object)
+    def __integer(x):
+        return isinstance(x, int)
+
+    __vector = array(shape=('n',))
+
+    @checks
+    def half(x: __integer, y: __vector = None) -> __vector:
+        return np.zeros(int(x))
+
+    policy('warn', rate=None)
+
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore')
+        assert half(2.).shape == (2,)
+        assert half(2, np.ones(3)).shape == (2,)
+
+    policy('raise')
+
+    with pytest.raises(TypeError):
+        half(2.)
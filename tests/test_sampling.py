@@ -0,0 +1,76 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Tests the sampling policies."""
+
+import threading
+
+import pytest
+
+from typical.sampling import one_in, per_second
+from typical.typical import checks
+
+#####################################################################
+# POLICIES
+#####################################################################
+
+def test_one_in():
+    __policy = one_in(4, seed=0)
+    __draws = [__policy() for __i in range(40)]
+
+    assert sum(__draws) == 10
+    assert __draws[:4].count(True) == 1
+    assert all(one_in(1)() for __i in range(10))
+
+    with pytest.raises(ValueError):
+        one_in(0)
+
+def test_one_in_is_deterministic():
+    __first, __second = one_in(7, seed=42), one_in(7, seed=42)
+
+    assert [__first() for __i in range(50)] == [__second() for __i in range(50)]
+
+def test_one_in_across_threads():
+    __policy = one_in(10, seed=3)
+    __draws = []
+
+    def __draw():
+        __draws.extend(__policy() for __i in range(1000))
+
+    __threads = [threading.Thread(target=__draw) for __i in range(8)]
+    for __thread in __threads:
+        __thread.start()
+    for __thread in __threads:
+        __thread.join()
+
+    assert sum(__draws) == 800
+
+def test_per_second():
+    __time = [100.2]
+    __policy = per_second(3, clock=lambda: __time[0])
+
+    assert [__policy() for __i in range(5)] == [True, True, True, False, False]
+
+    __time[0] = 100.9
+    assert not __policy()
+
+    __time[0] = 101.1
+    assert [__policy() for __i in range(5)] == [True, True, True, False, False]
+
+#####################################################################
+# SAMPLED CHECKS
+#####################################################################
+
+def test_sampled_checks():
+    @checks(sample=one_in(3, seed=0))
+    def double(x: int) -> int:
+        return 2 * x
+
+    __failures = 0
+    for __i in range(9):
+        try:
+            double(1.5)
+        except TypeError:
+            __failures += 1
+
+    assert __failures == 3
@@ -50,3 +50,19 @@ def test_symbolic():
 
     for a in ok:
         assert symbolic(a)
+
+def test_symbolic_on_arrays():
+    x, y = smp.symbols('x y')
+
+    __expressions = np.empty(1000, dtype=object)
+    __expressions[:] = [x + i * y for i in range(999)] + [smp.cos(x)]
+
+    assert symbolic(__expressions)
+    assert symbolic(np.array([x, 1, 2.5, np.float32(3), True], dtype=object))
+    assert not symbolic(np.array([1 + 2j, 3j]))
+    assert not symbolic(np.complex128(1j))
+
+    __expressions[500] = None
+
+    assert not symbolic(__expressions)
+    assert not symbolic(np.array([x, 'abc'], dtype=object))
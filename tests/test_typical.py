@@ -0,0 +1,386 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Tests the checking decorator."""
+
+import gc
+import inspect
+import weakref
+import numpy as np
+
+import pytest
+
+import typical.typical
+from typical.generic import stream
+from typical.iterable import array
+from typical.numeric import finite
+from typical.typical import (
+    _parse_switches,
+    checks,
+    disable,
+    enable,
+    is_enabled,
+    trusted,
+    type_only)
+
+#####################################################################
+# DECORATOR
+#####################################################################
+
+def test_checks_on_valid_calls():
+    @checks
+    def average(x: int, y: int, z: int = 0) -> float:
+        return (x + y + z) / 3
+
+    assert average(1, 2, 3) == 2.
+    assert average(1, 2) == 1.
+    assert average(1, y=2, z=3) == 2.
+
+def test_checks_on_invalid_arguments():
+    @checks
+    def average(x: int, y: int, z: int = 0) -> float:
+        return (x + y + z) / 3
+
+    with pytest.raises(TypeError):
+        average(1.5, 2, 3)
+
+    with pytest.raises(TypeError):
+        average(1, 2, z=3.5)
+
+    with pytest.raises(TypeError):
+        average(1, y='2')
+
+def test_checks_on_invalid_results():
+    @checks
+    def half(x: int) -> int:
+        return x / 2
+
+    with pytest.raises(TypeError):
+        half(3)
+
+def test_checks_on_all_kinds_of_parameters():
+    @checks
+    def total(x: int, *rest: float, scale: int = 1, **named: str) -> float:
+        return scale * (x + sum(rest))
+
+    assert total(1, 2., 3., scale=2, unit='m') == 12.
+
+    with pytest.raises(TypeError):
+        total(1, 2., 3)
+
+    with pytest.raises(TypeError):
+        total(1, scale=2.)
+
+    with pytest.raises(TypeError):
+        total(x=1.)
+
+    with pytest.raises(TypeError):
+        total(1, unit=1)
+
+def test_checks_on_default_values():
+    @checks
+    def shift(x: int, offset: int = None) -> int:
+        return x + (offset or 0)
+
+    assert shift(1, 2) == 3
+
+    with pytest.raises(TypeError):
+        shift(1)
+
+def test_checks_fails_before_running_the_body():
+    __calls = []
+
+    @checks
+    def fast(x: int) -> int:
+        __calls.append(x)
+        return x
+
+    @checks(fail_fast=False)
+    def slow(x: int) -> int:
+        __calls.append(x)
+        return x
+
+    with pytest.raises(TypeError):
+        fast(1.5)
+
+    assert not __calls
+
+    with pytest.raises(TypeError):
+        slow(1.5)
+
+    assert __calls == [1.5]
+
+def test_checks_inspects_the_signature_once(monkeypatch):
+    __calls = []
+    __getfullargspec = inspect.getfullargspec
+
+    def __counting_getfullargspec(func):
+        __calls.append(func)
+        return __getfullargspec(func)
+
+    monkeypatch.setattr(
+        typical.typical.inspect,
+        'getfullargspec',
+        __counting_getfullargspec)
+
+    @checks
+    def double(x: int) -> int:
+        return 2 * x
+
+    for __i in range(10):
+        assert double(__i) == 2 * __i
+
+    assert len(__calls) == 1
+
+def test_checks_generates_the_signature():
+    @checks
+    def clamp(x: int, /, _typical_low: int = 0, *, high: int = 10) -> int:
+        return min(max(x, _typical_low), high)
+
+    assert clamp(-1) == 0
+    assert clamp(12, 1, high=11) == 11
+
+    with pytest.raises(TypeError):
+        clamp(x=1)
+
+    with pytest.raises(TypeError):
+        clamp(1, _typical_low=0.5)
+
+    with pytest.raises(TypeError):
+        clamp(1, high=None)
+
+def test_checks_parameters_shadowing_the_builtins():
+    @checks
+    def describe(type: str, isinstance: finite, x: finite = 1.) -> str:
+        return '{}={}'.format(type, isinstance * x)
+
+    assert describe('a', 1) == 'a=1.0'
+    assert describe('a', 1) == 'a=1.0'
+
+    with pytest.raises(TypeError):
+        describe(1, 1)
+
+def test_checks_binds_the_array_shapes():
+    __samples = array(shape=('n', 'd'))
+    __weights = array(shape=('d',))
+    __vector = array(shape=('n',))
+
+    @checks
+    def predict(x: __samples, w: __weights) -> __vector:
+        return x @ w
+
+    assert predict(np.ones((5, 3)), np.ones(3)).shape == (5,)
+
+    with pytest.raises(TypeError):
+        predict(np.ones((5, 3)), np.ones(4))
+
+    @checks
+    def head(x: __vector) -> __vector:
+        return x[1:]
+
+    with pytest.raises(TypeError):
+        head(np.ones(3))
+
+def test_checks_preserves_the_metadata():
+    def scale(x: int, *rest: int, factor: float = 2.) -> float:
+        """Scales a number."""
+        return factor * x
+
+    __wrapper = checks(scale)
+
+    assert __wrapper.__wrapped__ is scale
+    assert __wrapper.__signature__ == inspect.signature(scale)
+    assert inspect.signature(__wrapper) == inspect.signature(scale)
+    assert __wrapper.__name__ == 'scale'
+    assert __wrapper.__qualname__ == scale.__qualname__
+    assert __wrapper.__doc__ == 'Scales a number.'
+    assert __wrapper.__annotations__ == scale.__annotations__
+    assert not hasattr(typical.typical, 'decorate')
+
+def test_checks_runs_the_generated_code_in_place():
+    @checks
+    def scale(x: int, factor: float = 2.) -> float:
+        return factor * x
+
+    assert scale(2) == 4.
+    assert scale.__code__.co_varnames[:2] == ('x', 'factor')
+    assert '_typical_isinstance' in scale.__code__.co_names
+    assert '_typical_func' in scale.__code__.co_names
+
+    __reference = weakref.ref(scale)
+    del scale
+    gc.collect()
+
+    assert __reference() is None
+
+#####################################################################
+# TRUSTED PREDICATES
+#####################################################################
+
+@pytest.mark.skipif(typical.typical._DEBUG, reason='debug mode')
+def test_trusted_predicates_run_unchecked():
+    @trusted
+    def positive(x: int) -> bool:
+        return x > 0
+
+    assert positive(2.5)
+    assert not hasattr(positive, '__wrapped__')
+
+    assert positive.checked(2)
+    assert positive.checked.__wrapped__ is positive
+
+    with pytest.raises(TypeError):
+        positive.checked(2.5)
+
+@pytest.mark.skipif(typical.typical._DEBUG, reason='debug mode')
+def test_library_predicates_are_trusted():
+    assert finite.checked(np.arange(4))
+    assert not hasattr(finite, '__wrapped__')
+
+#####################################################################
+# SWITCH
+#####################################################################
+
+@pytest.fixture
+def switches():
+    yield
+    enable()
+
+def test_switch_parsing():
+    assert _parse_switches('') == {None: True}
+    assert _parse_switches('off, myapp.api=on') == {None: False, 'myapp.api': True}
+    assert _parse_switches('myapp=0,myapp.api=1') == {None: True, 'myapp': False, 'myapp.api': True}
+
+def test_switch_globally(switches):
+    @checks
+    def double(x: int) -> int:
+        return 2 * x
+
+    disable()
+    assert not is_enabled()
+    assert double(1.5) == 3.
+
+    enable()
+    with pytest.raises(TypeError):
+        double(1.5)
+
+def test_switch_per_module(switches):
+    @checks
+    def double(x: int) -> int:
+        return 2 * x
+
+    disable(__name__)
+    assert is_enabled()
+    assert not is_enabled(__name__ + '.submodule')
+    assert double(1.5) == 3.
+
+    disable()
+    enable(__name__)
+    with pytest.raises(TypeError):
+        double(1.5)
+
+#####################################################################
+# INLINE CACHE
+#####################################################################
+
+def test_cache_skips_type_only_predicates():
+    __calls = []
+
+    @type_only(int, float)
+    def __real(x):
+        __calls.append(x)
+        return isinstance(x, (int, float))
+
+    def __positive(x):
+        __calls.append(x)
+        return x > 0
+
+    @checks
+    def half(x: __real, y: __positive = 1) -> float:
+        return x / 2
+
+    half(2)
+    half(4)
+    half(6, y=3)
+    half(8, y=5)
+
+    assert __calls == [2, 1, 1, 3, 5]
+
+    with pytest.raises(TypeError):
+        half(6, y=-1)
+
+    with pytest.raises(TypeError):
+        half('a')
+
+def test_cache_is_bounded():
+    __calls = []
+
+    @type_only(object)
+    def __spy(x):
+        __calls.append(x)
+        return True
+
+    @checks(cache=2)
+    def identity(x: __spy) -> object:
+        return x
+
+    for __x in (1, 2, 3., 4., 'a', 6, 7):
+        identity(__x)
+
+    assert __calls == [1, 3., 'a', 6]
+
+    @checks(cache=0)
+    def uncached(x: __spy) -> object:
+        return x
+
+    uncached(8)
+    uncached(9)
+
+    assert __calls[-2:] == [8, 9]
+
+#####################################################################
+# STREAMING
+#####################################################################
+
+def test_streams_are_checked_lazily():
+    __pulled = []
+
+    def __produce():
+        for __x in (1, 2, 'a', 4):
+            __pulled.append(__x)
+            yield __x
+
+    @checks
+    def doubles(values: stream(int)) -> stream(int):
+        return (2 * __x for __x in values)
+
+    __doubles = doubles(__produce())
+
+    assert not __pulled
+    assert next(__doubles) == 2
+    assert next(__doubles) == 4
+    assert __pulled == [1, 2]
+
+    with pytest.raises(TypeError):
+        next(__doubles)
+
+    with pytest.raises(TypeError, match=r'stream\(int\)'):
+        doubles(3)
+
+def test_streamed_results_are_checked():
+    @checks
+    def halves(values: stream(int)) -> stream(int):
+        return (__x / 2 for __x in values)
+
+    __halves = halves(values=iter([2, 4]))
+
+    with pytest.raises(TypeError):
+        next(__halves)
+
+def test_streamed_elements_follow_the_decorator_settings():
+    @checks(elements=None)
+    def first(values: stream(list[int])):
+        return next(iter(values))
+
+    with pytest.raises(TypeError):
+        first([list(range(1000)) + ['a']])
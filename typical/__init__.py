@@ -8,6 +8,7 @@ specified types or predicates.
 
 Examples
 --------
+    >>> on_failure('warn')
     >>> @checks
     ... def average(x: int, y:int, z:int) -> float:
     ...     return (x + y + z) / 2
@@ -22,25 +23,106 @@ Examples
 """
 
 from __future__ import division, print_function, absolute_import
-from importlib.metadata import version
-
-from typical.generic import (
-    all_of,
-    anything,
-    exactly,
-    iterable,
-    nothing,
-    one_of)
-from typical.iterable import scalar
-from typical.numeric import finite, numeric
-from typical.optimization import bounds, specifications
-from typical.plottable import trace_data
-from typical.symbolic import symbolic
-from typical.typical import checks
+
+import importlib
+import sys
+import types
 
 __author__ = 'apehex'
 __email__ = 'apehex@protonmail.com'
-__version__ = version(__package__)
+
+#####################################################################
+# LAZY LOADING
+#####################################################################
+
+# the submodules, and their heavy dependencies like numpy and sympy,
+# are only imported when one of their members is first accessed ; the
+# bindings are those of the eager imports : 'typical.iterable' is the
+# submodule, while 'typical.numeric' and 'typical.symbolic' are the
+# predicates, and use 'typical.generic.iterable' for the predicate
+
+_LAZY = {
+    'all_of': 'generic',
+    'anything': 'generic',
+    'exactly': 'generic',
+    'nothing': 'generic',
+    'one_of': 'generic',
+    'stream': 'generic',
+    'array': 'iterable',
+    'scalar': 'iterable',
+    'find_nonfinite': 'numeric',
+    'find_nonnumeric': 'numeric',
+    'finite': 'numeric',
+    'numeric': 'numeric',
+    'bounds': 'optimization',
+    'find_invalid_bounds': 'optimization',
+    'parse_specifications': 'optimization',
+    'specifications': 'optimization',
+    'trace_data': 'plottable',
+    'one_in': 'sampling',
+    'parallelize': 'parallel',
+    'per_second': 'sampling',
+    'reset_stats': 'profiling',
+    'TypeWarning': 'reporting',
+    'on_failure': 'reporting',
+    'stats': 'profiling',
+    'symbolic': 'symbolic',
+    'checks': 'typical',
+    'disable': 'typical',
+    'enable': 'typical',
+    'is_enabled': 'typical',
+    'profile': 'typical'}
+
+_SUBMODULES = (
+    'bench',
+    'generic',
+    'hints',
+    'iterable',
+    'numeric',
+    'optimization',
+    'parallel',
+    'plottable',
+    'profiling',
+    'reporting',
+    'sampling',
+    'symbolic',
+    'typical')
+
+_SHADOWING = ('numeric', 'symbolic')    # predicates named after their submodule
+
+def __getattr__(name):
+    if name == '__version__':
+        from importlib.metadata import version
+        globals()[name] = version(__package__)
+    elif name in _LAZY:
+        globals()[name] = getattr(
+            importlib.import_module('.' + _LAZY[name], __package__),
+            name)
+    elif name in _SUBMODULES:
+        return importlib.import_module('.' + name, __package__)
+    else:
+        raise AttributeError(
+            "module '{}' has no attribute '{}'".format(__name__, name))
+    return globals()[name]
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
+
+class _Package(types.ModuleType):
+    """
+    Keeps the 'numeric' and 'symbolic' predicates from being shadowed by
+    the submodules of the same name, when these are imported.
+    """
+    def __setattr__(self, name, value):
+        if name in _SHADOWING and isinstance(value, types.ModuleType):
+            return
+        super().__setattr__(name, value)
+
+sys.modules[__name__].__class__ = _Package
+
+#####################################################################
+# PUBLIC API
+#####################################################################
 
 __all__ = [
     'all_of',
@@ -48,24 +130,49 @@ __all__ = [
     'exactly',
     'iterable',
     'nothing',
-    'one_of']
+    'one_of',
+    'stream']
 
 __all__ += [
+    'array',
     'scalar']
 
 __all__ += [
+    'find_nonfinite',
+    'find_nonnumeric',
     'finite',
     'numeric']
 
 __all__ += [
     'bounds',
+    'find_invalid_bounds',
+    'parse_specifications',
     'specifications']
 
+__all__ += [
+    'parallelize']
+
 __all__ += [
     'trace_data']
 
+__all__ += [
+    'one_in',
+    'per_second']
+
+__all__ += [
+    'reset_stats',
+    'stats']
+
+__all__ += [
+    'TypeWarning',
+    'on_failure']
+
 __all__ += [
     'symbolic']
 
 __all__ += [
-    'checks']
+    'checks',
+    'disable',
+    'enable',
+    'is_enabled',
+    'profile']
@@ -0,0 +1,351 @@
+# -*- coding: utf-8 -*-
+
+"""
+==========
+Benchmarks
+==========
+
+Measures the cost of the checks : the time taken to import the package,
+the per-call overhead of `checks` against the undecorated functions, and
+the time taken by each public predicate on scalars, lists, dicts and
+arrays of growing sizes.
+
+The results are printed as JSON, to be compared between releases.
+
+Examples
+--------
+    $ python -m typical.bench --max-size 100000 --output bench.json
+"""
+
+from __future__ import division, print_function, absolute_import
+
+import argparse
+import itertools
+import json
+import os
+import platform
+import subprocess
+import sys
+import timeit
+
+import numpy as np
+
+from .iterable import scalar
+from .numeric import finite, numeric
+from .optimization import bounds, specifications
+from .plottable import trace_data
+from .symbolic import symbolic
+from .typical import checks, disable, enable, is_enabled
+
+#####################################################################
+# TIMING
+#####################################################################
+
+def _time(call: callable) -> float:
+    """
+    Measures the duration of a call, repeating it when it's fast.
+
+    Parameters
+    ----------
+    call: callable.
+        A function without arguments.
+
+    Returns
+    -------
+    out: float.
+        The best duration of a single call, in seconds.
+    """
+    __timer = timeit.Timer(call)
+    __number, __total = __timer.autorange()
+
+    if __total < 1.:
+        __total = min([__total] + __timer.repeat(repeat=2, number=__number))
+
+    return __total / __number
+
+#####################################################################
+# IMPORT TIME
+#####################################################################
+
+_STARTUP = """
+import sys, time
+__start = time.perf_counter()
+import typical
+@typical.checks
+def f(x: int) -> int:
+    return x
+__seconds = time.perf_counter() - __start
+print(__seconds, 'numpy' in sys.modules, 'sympy' in sys.modules)
+"""
+
+def imports(repeat: int = 5) -> dict:
+    """
+    Measures the time taken to import the package and decorate a function,
+    in fresh interpreters.
+
+    Parameters
+    ----------
+    repeat: int.
+        The number of interpreters launched.
+
+    Returns
+    -------
+    out: dict.
+        The best duration in seconds, and whether numpy / sympy were
+        imported along.
+    """
+    __runs = []
+
+    for __i in range(repeat):
+        __output = subprocess.run(
+            [sys.executable, '-c', _STARTUP],
+            cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+            capture_output=True,
+            check=True,
+            text=True).stdout.split()
+        __runs.append((float(__output[0]), __output[1] == 'True', __output[2] == 'True'))
+
+    __seconds, __numpy, __sympy = min(__runs)
+
+    return {'seconds': __seconds, 'numpy': __numpy, 'sympy': __sympy}
+
+#####################################################################
+# DECORATOR OVERHEAD
+#####################################################################
+
+def _types(x: int, y: float) -> float:
+    return x + y
+
+def _predicates(x: numeric, y: finite) -> float:
+    return x + y
+
+def _variadic(x: int, *rest: float, scale: int = 1, **named: str) -> float:
+    return scale * (x + sum(rest))
+
+_SIGNATURES = {
+    'types': (_types, (1, 2.), {}),
+    'keywords': (_types, (), {'x': 1, 'y': 2.}),
+    'predicates': (_predicates, (1, 2.), {}),
+    'variadic': (_variadic, (1, 2., 3.), {'scale': 2, 'unit': 'm'})}
+
+def overhead() -> list:
+    """
+    Measures the per-call overhead of `checks`, enabled and disabled,
+    against the undecorated functions.
+
+    Returns
+    -------
+    out: list.
+        One record per signature, with the durations in seconds.
+    """
+    __records = []
+    __enabled = is_enabled(__name__)
+
+    for __name, (__func, __args, __kwargs) in _SIGNATURES.items():
+        __checked = checks(__func)
+        __record = {
+            'signature': __name,
+            'raw': _time(lambda: __func(*__args, **__kwargs))}
+
+        enable(__name__)
+        __record['enabled'] = _time(lambda: __checked(*__args, **__kwargs))
+        disable(__name__)
+        __record['disabled'] = _time(lambda: __checked(*__args, **__kwargs))
+
+        __record['overhead'] = __record['enabled'] - __record['raw']
+        __records.append(__record)
+
+    (enable if __enabled else disable)(__name__)
+
+    return __records
+
+#####################################################################
+# PREDICATES
+#####################################################################
+
+def _values(size: int) -> dict:
+    """
+    Generates the inputs of the element-wise predicates.
+
+    Parameters
+    ----------
+    size: int.
+        The number of elements.
+
+    Returns
+    -------
+    out: dict.
+        The input of each kind : list, dict and ndarray.
+    """
+    __array = np.random.default_rng(size).random(size)
+    return {
+        'list': __array.tolist(),
+        'dict': dict(enumerate(__array.tolist())),
+        'ndarray': __array}
+
+def _bounds(size: int) -> dict:
+    """
+    Generates the inputs of the bounds and specifications predicates.
+
+    Parameters
+    ----------
+    size: int.
+        The number of bound tuples.
+
+    Returns
+    -------
+    out: dict.
+        The input of each kind : list, dict and ndarray.
+    """
+    __array = np.random.default_rng(size).random((size, 2))
+    __array.sort(axis=1)
+    return {
+        'list': [tuple(__row) for __row in __array.tolist()],
+        'dict': {__i: tuple(__row) for __i, __row in enumerate(__array.tolist())},
+        'ndarray': __array}
+
+def _traces(size: int) -> dict:
+    """
+    Generates the inputs of the trace predicate.
+
+    Parameters
+    ----------
+    size: int.
+        The number of points.
+
+    Returns
+    -------
+    out: dict.
+        The input of each kind : list and ndarray columns.
+    """
+    __array = np.random.default_rng(size).random((2, size))
+    return {
+        'list': {'x': __array[0].tolist(), 'y': __array[1].tolist(), 'name': 'bench'},
+        'ndarray': {'x': __array[0], 'y': __array[1], 'name': 'bench'}}
+
+_PREDICATES = {
+    'numeric': (numeric, 1.5, _values),
+    'finite': (finite, 1.5, _values),
+    'symbolic': (symbolic, 1.5, _values),
+    'scalar': (scalar, 1.5, _values),
+    'bounds': (bounds, (0., 1.), _bounds),
+    'specifications': (specifications, (0., 1.), _bounds),
+    'trace_data': (trace_data, None, _traces)}
+
+def _measure(predicate: callable, x) -> dict:
+    """
+    Times a predicate on a given input.
+
+    Parameters
+    ----------
+    predicate: callable.
+        The predicate to benchmark.
+    x:
+        Its input.
+
+    Returns
+    -------
+    out: dict.
+        The duration in seconds and the verdict, or the error raised.
+    """
+    try:
+        __result = bool(predicate(x))
+    except Exception as __error:
+        return {'error': repr(__error)}
+    return {'seconds': _time(lambda: predicate(x)), 'result': __result}
+
+def predicates(sizes: list) -> list:
+    """
+    Times every public predicate on scalars, and on lists, dicts and
+    arrays of the given sizes.
+
+    Parameters
+    ----------
+    sizes: list.
+        The numbers of elements.
+
+    Returns
+    -------
+    out: list.
+        One record per predicate, input kind and size.
+    """
+    __records = []
+
+    for __name, (__predicate, __scalar, __inputs) in _PREDICATES.items():
+        if __scalar is not None:
+            __records.append(dict(
+                predicate=__name,
+                kind='scalar',
+                size=1,
+                **_measure(__predicate, __scalar)))
+
+        for __size in sizes:
+            for __kind, __x in __inputs(__size).items():
+                __records.append(dict(
+                    predicate=__name,
+                    kind=__kind,
+                    size=__size,
+                    **_measure(__predicate, __x)))
+
+    return __records
+
+#####################################################################
+# REPORT
+#####################################################################
+
+def run(max_size: int = 10 ** 7) -> dict:
+    """
+    Runs all the benchmarks.
+
+    Parameters
+    ----------
+    max_size: int.
+        The largest input size, the sizes growing by powers of 10.
+
+    Returns
+    -------
+    out: dict.
+        The environment and the results, ready for JSON.
+    """
+    __sizes = list(itertools.takewhile(
+        lambda __size: __size <= max_size,
+        (10 ** __i for __i in itertools.count())))
+
+    return {
+        'environment': {
+            'python': platform.python_version(),
+            'numpy': np.__version__,
+            'platform': platform.platform()},
+        'imports': imports(),
+        'overhead': overhead(),
+        'predicates': predicates(__sizes)}
+
+def main(argv: list = None):
+    """
+    Runs the benchmarks from the command line and prints the JSON report.
+
+    Parameters
+    ----------
+    argv: list.
+        The command line arguments, sys.argv by default.
+    """
+    __parser = argparse.ArgumentParser(
+        prog='python -m typical.bench',
+        description='Measures the cost of the typical checks.')
+    __parser.add_argument(
+        '--max-size',
+        type=int,
+        default=10 ** 7,
+        help='largest input size, the sizes growing by powers of 10')
+    __parser.add_argument(
+        '--output',
+        type=argparse.FileType('w'),
+        default=sys.stdout,
+        help='file receiving the JSON report, stdout by default')
+    __args = __parser.parse_args(argv)
+
+    json.dump(run(__args.max_size), __args.output, indent=2)
+    __args.output.write('\n')
+
+if __name__ == '__main__':
+    main()
@@ -8,13 +8,70 @@ Generic Predicates
 
 from __future__ import division, print_function, absolute_import
 
-from .typical import _check, checks
+import types
+
+from .typical import trusted, type_only
+
+#####################################################################
+# COMBINATORS
+#####################################################################
+
+def _flatten(checkers, attribute):
+    """
+    Inlines the checkers of nested combinators of the same kind.
+
+    Parameters
+    ----------
+    checkers: list.
+        List of checker types / callables.
+    attribute: str.
+        The attribute holding the checkers of a combinator.
+
+    Returns
+    -------
+    out: tuple.
+        The flat list of checkers.
+    """
+    return tuple(
+        __checker
+        for __nested in checkers
+        for __checker in getattr(__nested, attribute, (__nested,)))
+
+def _split(checkers):
+    """
+    Sorts the checkers between types and predicates, like `_check`.
+
+    Parameters
+    ----------
+    checkers: list.
+        List of checker types / callables.
+
+    Returns
+    -------
+    out: tuple.
+        The types, the predicates and whether some checkers accept
+        anything (neither types nor callables).
+    """
+    __types = tuple(
+        __checker
+        for __checker in checkers
+        if type(__checker) == type)
+    __predicates = tuple(
+        __checker
+        for __checker in checkers
+        if type(__checker) != type and callable(__checker))
+
+    return (
+        __types,
+        __predicates,
+        len(__types) + len(__predicates) < len(checkers))
 
 #####################################################################
 # GENERIC PREDICATES
 #####################################################################
 
-@checks
+@trusted
+@type_only(object)
 def anything(x) -> bool:
     """
     Accepts all the input values.
@@ -31,7 +88,8 @@ def anything(x) -> bool:
     """
     return True
 
-@checks
+@trusted
+@type_only(object)
 def nothing(x) -> bool:
     """
     Checks whether an input is None.
@@ -48,7 +106,7 @@ def nothing(x) -> bool:
     """
     return x is None
 
-@checks
+@trusted
 def exactly(y) -> callable:
     """
     Checks whether an input has exactly the same content as
@@ -72,11 +130,14 @@ def exactly(y) -> callable:
 
     return _exactly
 
-@checks
+@trusted
 def one_of(*checkers) -> callable:
     """
     Checks whether an input satisfies at least one of the given checkers.
 
+    Nested `one_of` are flattened, and all the types are tested with
+    a single `isinstance` call ; the checking stops at the first match.
+
     Parameters
     ----------
     checkers: list.
@@ -87,18 +148,32 @@ def one_of(*checkers) -> callable:
     out: bool.
         True of any of the checkers is satisfied.
     """
+    __checkers = _flatten(checkers, '_one_of')
+    __types, __predicates, __anything = _split(__checkers)
+
+    if __anything:
+        __types = (object,)
+
     def __one_of(x):
-        return any([
-            _check(x, __checker)
-            for __checker in checkers])
+        if isinstance(x, __types):
+            return True
+        for __predicate in __predicates:
+            if __predicate(x):
+                return True
+        return False
+
+    __one_of._one_of = __checkers
 
     return __one_of
 
-@checks
+@trusted
 def all_of(*checkers) -> callable:
     """
     Checks whether an input satisfies all the given checkers.
 
+    Nested `all_of` are flattened ; the checking stops at the first
+    failure.
+
     Parameters
     ----------
     checkers: list.
@@ -109,14 +184,59 @@ def all_of(*checkers) -> callable:
     out: bool.
         True of all of the checkers are satisfied.
     """
+    __checkers = _flatten(checkers, '_all_of')
+    __types, __predicates, _ = _split(__checkers)
+
     def __all_of(x):
-        return all([
-            _check(x, __checker)
-            for __checker in checkers])
+        for __type in __types:
+            if not isinstance(x, __type):
+                return False
+        for __predicate in __predicates:
+            if not __predicate(x):
+                return False
+        return True
+
+    __all_of._all_of = __checkers
 
     return __all_of
 
-@checks
+@trusted
+def stream(checker) -> callable:
+    """
+    Checks the elements of an iterable lazily, as they're consumed.
+
+    When annotating a parameter or the return value of a function
+    decorated with `checks`, the iterable is wrapped in an iterator
+    validating each element as it's pulled : generators are checked
+    without being consumed upfront, in constant memory.
+
+    ! NOTE !
+    Called directly, the predicate only checks that the input is
+    iterable.
+
+    Parameters
+    ----------
+    checker: type or callable.
+        The checker of each element.
+
+    Returns
+    -------
+    out: callable.
+        True if the input is iterable.
+    """
+    def __stream(x):
+        return iterable(x)
+
+    __stream.element = checker
+    __stream.__name__ = __stream.__qualname__ = 'stream({})'.format(
+        checker.__name__
+        if type(checker) == type or isinstance(checker, types.FunctionType)
+        else repr(checker))
+
+    return __stream
+
+@trusted
+@type_only(list, tuple, dict, set, frozenset, str, bytes, range, int, float, type(None))
 def iterable(x) -> bool:
     """
     Checks whether an object is iterable.
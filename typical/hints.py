@@ -0,0 +1,320 @@
+# -*- coding: utf-8 -*-
+
+"""
+==========
+Type Hints
+==========
+
+Compiles the annotations of the `typing` module, and their PEP 585 /
+PEP 604 spellings, into predicates : `List[int]`, `dict[str, float]`,
+`Optional[int]`, `int | None`...
+
+The hints are translated once, when a function is decorated. The unions
+of classes become a single `isinstance` test ; the containers check their
+own type, then their elements down to a given depth. By default, only a
+sample of the elements is checked on each call : a window at a random
+position in the lists and tuples, wrapping around their end, random
+elements of the other sequences, and the first elements of the other
+containers.
+
+The iterators and generators are never consumed : only their type is
+checked, see `stream` for lazy element checks.
+
+Examples
+--------
+    >>> @checks(elements=None)
+    ... def total(x: list[int]) -> int:
+    ...     return sum(x)
+"""
+
+from __future__ import division, print_function, absolute_import
+
+import abc
+import collections.abc
+import itertools
+import random
+import types
+import typing
+
+#####################################################################
+# SETTINGS
+#####################################################################
+
+_DEPTH = 2          # levels of nested containers whose elements are checked
+_ELEMENTS = 32      # elements checked in each container, None for all of them
+
+_NONE = type(None)
+
+_UNIONS = (typing.Union, getattr(types, 'UnionType', typing.Union))
+
+_RANDOM = random.Random()   # private, the seeded global state is left alone
+
+#####################################################################
+# ELEMENTS
+#####################################################################
+
+def _instance_of(classes: tuple) -> callable:
+    """
+    Checks the type of an input, and records the classes so that the
+    test can be inlined.
+
+    Parameters
+    ----------
+    classes: tuple.
+        The accepted classes.
+
+    Returns
+    -------
+    out: callable.
+        The predicate, with the classes as `_isinstance` attribute.
+    """
+    def __instance_of(x):
+        return isinstance(x, classes)
+
+    __instance_of._isinstance = classes
+
+    return __instance_of
+
+def _sample(x, elements: int):
+    """
+    Picks the elements of a container to check.
+
+    Parameters
+    ----------
+    x: collection.
+        The container.
+    elements: int.
+        The number of elements to check, None for all of them.
+
+    Returns
+    -------
+    out: iterable.
+        The elements to check.
+    """
+    if elements is None or len(x) <= elements:
+        return x
+    elif isinstance(x, (list, tuple)):
+        __start = _RANDOM.randrange(len(x))
+        __window = x[__start:__start + elements]
+        return __window + x[:elements - len(__window)]
+    elif isinstance(x, collections.abc.Sequence):
+        return map(x.__getitem__, _RANDOM.sample(range(len(x)), elements))
+    return itertools.islice(x, elements)
+
+def _all(checker: callable) -> callable:
+    """
+    Checks all the given elements, resolving each distinct type once when
+    the checker only tests the type.
+
+    Parameters
+    ----------
+    checker: callable.
+        The predicate on each element.
+
+    Returns
+    -------
+    out: callable.
+        The predicate on an iterable of elements.
+    """
+    __classes = getattr(checker, '_isinstance', None)
+
+    if __classes is None:
+        return lambda __elements: all(map(checker, __elements))
+
+    return lambda __elements: all(
+        issubclass(__type, __classes)
+        for __type in set(map(type, __elements)))
+
+#####################################################################
+# COMPILATION
+#####################################################################
+
+def is_hint(annotation) -> bool:
+    """
+    Tells whether an annotation is a type hint, rather than a predicate.
+
+    Parameters
+    ----------
+    annotation:
+        The annotation of a parameter or of the return value.
+
+    Returns
+    -------
+    out: bool.
+        True for the generic aliases, unions, type variables, new types,
+        abstract classes, `typing.Any` and None.
+    """
+    return (
+        annotation is None
+        or annotation is typing.Any
+        or typing.get_origin(annotation) is not None
+        or hasattr(annotation, '__supertype__')
+        or isinstance(annotation, (abc.ABCMeta, typing.TypeVar)))
+
+def _union(hints: tuple, depth: int, elements: int) -> callable:
+    """
+    Compiles a union of hints.
+
+    Parameters
+    ----------
+    hints: tuple.
+        The members of the union.
+    depth: int.
+        The levels of nested containers whose elements are checked.
+    elements: int.
+        The number of elements checked in each container.
+
+    Returns
+    -------
+    out: callable.
+        The predicate, None if the union accepts anything.
+    """
+    __checkers = [compile_hint(__hint, depth, elements) for __hint in hints]
+
+    if any(__checker is None for __checker in __checkers):
+        return None
+
+    __classes = tuple(
+        __class
+        for __checker in __checkers
+        for __class in getattr(__checker, '_isinstance', ()))
+    __predicates = tuple(
+        __checker
+        for __checker in __checkers
+        if not hasattr(__checker, '_isinstance'))
+
+    if not __predicates:
+        return _instance_of(__classes)
+
+    def __union(x):
+        if isinstance(x, __classes):
+            return True
+        for __predicate in __predicates:
+            if __predicate(x):
+                return True
+        return False
+
+    return __union
+
+def _container(origin: type, hints: tuple, depth: int, elements: int) -> callable:
+    """
+    Compiles a parametrized container, like `list[int]` or `Dict[str, float]`.
+
+    Parameters
+    ----------
+    origin: type.
+        The class of the container.
+    hints: tuple.
+        The type parameters.
+    depth: int.
+        The levels of nested containers whose elements are checked.
+    elements: int.
+        The number of elements checked in each container.
+
+    Returns
+    -------
+    out: callable.
+        The predicate.
+    """
+    __instance_of = _instance_of((origin,))
+
+    if not hints or depth == 0 or not issubclass(origin, collections.abc.Collection):
+        return __instance_of
+
+    __depth = None if depth is None else depth - 1
+
+    if issubclass(origin, collections.abc.Mapping):
+        __keys = compile_hint(hints[0], __depth, elements)
+        __values = compile_hint(hints[-1], __depth, elements) if len(hints) == 2 else None
+        if __keys is None and __values is None:
+            return __instance_of
+        __all_keys = _all(__keys) if __keys is not None else lambda __x: True
+        __all_values = _all(__values) if __values is not None else lambda __x: True
+
+        def __mapping(x):
+            return (
+                isinstance(x, origin)
+                and __all_keys(_sample(x.keys(), elements))
+                and __all_values(_sample(x.values(), elements)))
+
+        return __mapping
+
+    if issubclass(origin, tuple) and not (len(hints) == 2 and hints[1] is Ellipsis):
+        __checkers = tuple(compile_hint(__hint, __depth, elements) for __hint in hints)
+
+        def __tuple(x):
+            return (
+                isinstance(x, origin)
+                and len(x) == len(__checkers)
+                and all(
+                    __checker is None or __checker(__element)
+                    for __checker, __element in zip(__checkers, x)))
+
+        return __tuple
+
+    __element = compile_hint(hints[0], __depth, elements)
+
+    if __element is None:
+        return __instance_of
+
+    __all_elements = _all(__element)
+
+    def __collection(x):
+        return isinstance(x, origin) and __all_elements(_sample(x, elements))
+
+    return __collection
+
+def compile_hint(hint, depth: int = _DEPTH, elements: int = _ELEMENTS) -> callable:
+    """
+    Turns a type hint into a predicate, once and for all.
+
+    Parameters
+    ----------
+    hint:
+        A class, a hint from the `typing` module or a generic alias.
+    depth: int.
+        The levels of nested containers whose elements are checked, None
+        for all of them.
+    elements: int.
+        The number of elements checked in each container, None for all
+        of them.
+
+    Returns
+    -------
+    out: callable.
+        The predicate, None if the hint accepts anything. When it only
+        tests the type, the predicate records the accepted classes in
+        its `_isinstance` attribute.
+    """
+    __origin = typing.get_origin(hint)
+    __args = typing.get_args(hint)
+
+    if hint is typing.Any:
+        return None
+    elif hint is None or hint is _NONE:
+        return _instance_of((_NONE,))
+    elif isinstance(hint, typing.TypeVar):
+        if hint.__constraints__:
+            return _union(hint.__constraints__, depth, elements)
+        return None if hint.__bound__ is None else compile_hint(hint.__bound__, depth, elements)
+    elif hasattr(hint, '__supertype__'):
+        return compile_hint(hint.__supertype__, depth, elements)
+    elif __origin in _UNIONS:
+        return _union(__args, depth, elements)
+    elif __origin is typing.Annotated:
+        return compile_hint(__args[0], depth, elements)
+    elif __origin is typing.Literal:
+        return lambda __x: any(
+            type(__x) == type(__value) and __x == __value
+            for __value in __args)
+    elif __origin is type:
+        __classes = _union(__args, 0, elements) if __args else None
+        __classes = getattr(__classes, '_isinstance', (object,))
+        return lambda __x: isinstance(__x, type) and issubclass(__x, __classes)
+    elif isinstance(__origin, type):
+        return _container(__origin, __args, depth, elements)
+    elif isinstance(hint, type):
+        return _instance_of((hint,))
+    elif callable(hint):
+        return hint
+    return None
@@ -10,9 +10,9 @@ from __future__ import division, print_function, absolute_import
 
 import numpy as np
 
-from .typical import checks
+from .typical import trusted
 
-from .generic import iterable
+from .generic import iterable, nothing, one_of
 
 #####################################################################
 # MATRIX & ARRAY PREDICATES
@@ -21,7 +21,7 @@ from .generic import iterable
 # TODO distinguish the scalar schecking from the numeric checking
 # and array can be numeric, but it won't be scalar
 # and a scalar can be numeric or not but it won't be array like
-@checks
+@trusted
 def _iterable_scalar(x) -> bool:
     """
     Checks whether an iterable argument is of dimension 1.
@@ -41,7 +41,7 @@ def _iterable_scalar(x) -> bool:
     elif iterable(x):
         return len(x) == 1
 
-@checks
+@trusted
 def scalar(x) -> bool:
     """
     Checks whether an argument is of dimension 1.
@@ -64,3 +64,87 @@ def scalar(x) -> bool:
         return _iterable_scalar(x)
     else:
         return True
+
+#####################################################################
+# ARRAY SPECIFICATIONS
+#####################################################################
+
+@trusted
+def array(dtype=None, shape: one_of(tuple, nothing) = None) -> callable:
+    """
+    Checks the dtype and the shape of a numpy array, without reading any
+    of its elements.
+
+    The shape gives the size of each axis : an int for a fixed size, None
+    for any size, or a name. The axes sharing a name must have the same
+    size, within the array and, when annotating a function decorated with
+    `checks`, across all its arguments and its result.
+
+    Linters like flake8 read the strings of an annotation as forward
+    references, and report the dimension names as undefined (F821) : the
+    specifications are better built outside of the signature.
+
+    Examples
+    --------
+        >>> matrix = array('float64', ('n', 'd'))
+        >>> vector = array('float64', ('d',))
+        >>> @checks
+        ... def project(x: matrix, w: vector) -> array(shape=(None,)):
+        ...     return x @ w
+
+    Parameters
+    ----------
+    dtype: type or str.
+        The dtype, like 'float32' or np.float64, or a family of dtypes
+        like np.floating ; None for any dtype.
+    shape: tuple.
+        The size of each axis ; None for any number of dimensions.
+
+    Returns
+    -------
+    out: callable.
+        True if the input is an array with the given dtype and shape.
+    """
+    __type = None
+    if isinstance(dtype, type) and issubclass(dtype, np.generic):
+        __type = dtype
+    elif dtype is not None:
+        __type = np.dtype(dtype).type
+
+    __axes = tuple(enumerate(shape or ()))
+    __ndim = None if shape is None else len(__axes)
+    __sizes = tuple(
+        (__axis, __size)
+        for __axis, __size in __axes
+        if isinstance(__size, (int, np.integer)))
+    __names = tuple(
+        (__axis, __size)
+        for __axis, __size in __axes
+        if isinstance(__size, str))
+    __repeated = tuple(
+        (__axis, __first)
+        for __axis, __name in __names
+        for __first in (min(__a for __a, __n in __names if __n == __name),)
+        if __first != __axis)
+
+    def __array(x):
+        if not isinstance(x, np.ndarray):
+            return False
+        if __type is not None and not issubclass(x.dtype.type, __type):
+            return False
+        if __ndim is not None and x.ndim != __ndim:
+            return False
+        for __axis, __size in __sizes:
+            if x.shape[__axis] != __size:
+                return False
+        for __axis, __first in __repeated:
+            if x.shape[__axis] != x.shape[__first]:
+                return False
+        return True
+
+    __array.__name__ = __array.__qualname__ = 'array(dtype={}, shape={})'.format(
+        getattr(__type, '__name__', None),
+        shape)
+    __array.dimensions = __names
+
+    return __array
@@ -8,21 +8,80 @@ Numeric Predicates
 
 from __future__ import division, print_function, absolute_import
 
+import numbers
+import os
 import numpy as np
 
-from .generic import iterable
-from .typical import checks
+from .generic import iterable, nothing, one_of
+from .parallel import all_slices, flat, parallel
+from .typical import trusted, type_only
+
+#####################################################################
+# NUMERIC TYPES
+#####################################################################
+
+_REAL_KINDS = 'biuf'        # bool, int, uint, float
+_FINITE_KINDS = 'biufc'     # same, plus complex
+
+_NUMERIC_TYPES = (numbers.Number, np.number, np.bool_)
+
+_CHUNK_SIZE = 2 ** 20       # elements scanned at once, out-of-core
 
 #####################################################################
 # NUMERIC PREDICATES
 #####################################################################
 
-@checks
+_NONNUMERIC_KINDS = 'cSU'     # complex, bytes, str
+
+_NUMERIC_SCALARS = {        # type => verdict, None when it depends on the value
+    bool: True,
+    int: True,
+    float: True,
+    complex: False,
+    str: False,
+    bytes: False,
+    type(None): False}
+_NUMERIC_SCALARS_SIZE = 256
+
+def _numeric_type(t: type) -> bool:
+    """
+    Decides whether the instances of a type are numeric, from its type
+    hierarchy only ; the verdict is memoized for each type.
+
+    Parameters
+    ----------
+    t: type.
+        The type of a scalar.
+
+    Returns
+    -------
+    out: bool.
+        True if all the instances are real numbers, False if none is, and
+        None when it depends on the value.
+    """
+    try:
+        return _NUMERIC_SCALARS[t]
+    except KeyError:
+        if issubclass(t, (numbers.Real, np.bool_)):
+            __verdict = True
+        elif issubclass(t, (numbers.Complex, str, bytes)):
+            __verdict = False
+        else:
+            __verdict = None
+        if len(_NUMERIC_SCALARS) < _NUMERIC_SCALARS_SIZE:
+            _NUMERIC_SCALARS[t] = __verdict
+        return __verdict
+
+@trusted
 def _numeric_scalar(x) -> bool:
     """
     Checks a scalar object value against all the numeric types at once :
     int, float, np.float64...
 
+    The known types are resolved with a lookup ; the conversion to float
+    is only attempted on the other objects, like 0-d arrays or symbolic
+    constants.
+
     Parameters
     ----------
     x:
@@ -32,6 +91,12 @@ def _numeric_scalar(x) -> bool:
     -------
     out: bool.
     """
+    __verdict = _NUMERIC_SCALARS.get(type(x))
+    if __verdict is None:
+        __verdict = _numeric_type(type(x))
+    if __verdict is not None:
+        return __verdict
+
     try:
         float(x)
     except ValueError:
@@ -41,14 +106,47 @@ def _numeric_scalar(x) -> bool:
     else:
         return True
 
-@checks
+def _numeric_values(x) -> bool:
+    """
+    Checks whether all the elements of a collection are numeric.
+
+    Each distinct type is resolved once ; only the elements whose type
+    is not decisive are checked one by one.
+
+    Parameters
+    ----------
+    x: collection.
+        The elements, iterated twice at most.
+
+    Returns
+    -------
+    out: bool.
+    """
+    __undecided = False
+
+    for __type in set(map(type, x)):
+        __verdict = _numeric_type(__type)
+        if __verdict is False:
+            return False
+        __undecided = __undecided or __verdict is None
+
+    return not __undecided or all(map(_numeric_scalar, x))
+
+@trusted
+@type_only(*_NUMERIC_TYPES)
 def numeric(x) -> bool:
     """
     Checks an object against all the numeric types at once :
     int, float, np.float64...
 
+    Only the real numbers are numeric : the complex values, scalars or
+    arrays, are rejected, since casting them to float drops their
+    imaginary part.
+
     ! NOTE !
     Can be used on array like objects and iterables.
+    Arrays are checked on their dtype ; only object arrays are walked.
+    The elements of collections are resolved by type, once per type.
 
     Parameters
     ----------
@@ -60,13 +158,15 @@ def numeric(x) -> bool:
     out: bool.
     """
     if isinstance(x, dict):
-        return bool(all(map(
-            _numeric_scalar,
-            x.values())))
+        return _numeric_values(x.values())
     elif isinstance(x, np.ndarray):
-        return bool(all(map(
-            _numeric_scalar,
-            x.flat)))
+        if x.dtype.kind in _REAL_KINDS:
+            return True
+        elif x.dtype.kind in _NONNUMERIC_KINDS:
+            return x.size == 0
+        return _numeric_values(x.ravel())
+    elif isinstance(x, (list, tuple, range)):
+        return _numeric_values(x)
     elif iterable(x):
         return bool(all(map(
             _numeric_scalar,
@@ -74,7 +174,7 @@ def numeric(x) -> bool:
     else:
         return _numeric_scalar(x)
 
-@checks
+@trusted
 def _finite_scalar(x) -> bool:
     """
     Checks whether a scalar input is a finite numeric value.
@@ -96,13 +196,16 @@ def _finite_scalar(x) -> bool:
     else:
         return bool(np.all(np.isfinite(x)))
 
-@checks
+@trusted
 def finite(x) -> bool:
     """
     Checks whether the input is (composed of) a finite numeric value.
 
     ! NOTE !
     Can be used on array like objects and iterables.
+    Numeric arrays are checked with a single reduction, split across
+    threads above the threshold set by `parallelize` ; only object arrays
+    are walked. Memory mapped arrays are scanned by chunks.
 
     Parameters
     ----------
@@ -118,7 +221,13 @@ def finite(x) -> bool:
         return bool(all(map(
             _finite_scalar,
             x.values())))
+    elif isinstance(x, np.memmap):
+        return find_nonfinite(x) is None
     elif isinstance(x, np.ndarray):
+        if x.dtype.kind in _FINITE_KINDS:
+            if parallel(x.size):
+                return all_slices(flat(x), lambda __slice: np.isfinite(__slice).all())
+            return bool(np.isfinite(x).all())
         return bool(all(map(
             _finite_scalar,
             x.flat)))
@@ -128,3 +237,124 @@ def finite(x) -> bool:
             x)))
     else:
         return _finite_scalar(x)
+
+#####################################################################
+# CHUNKED SCANS
+#####################################################################
+
+def _load(x) -> np.ndarray:
+    """
+    Maps a .npy file in memory, without reading it.
+
+    Parameters
+    ----------
+    x: str, os.PathLike or np.ndarray.
+        The path to a .npy file, or an array already.
+
+    Returns
+    -------
+    out: np.ndarray.
+        The array, memory mapped in read-only mode if it's a file.
+    """
+    if isinstance(x, (str, os.PathLike)):
+        return np.load(x, mmap_mode='r')
+    return x
+
+def _first_invalid(x: np.ndarray, invalid: callable, chunk_size: int) -> tuple:
+    """
+    Scans an array by slabs along its first axis, and locates the first
+    invalid element.
+
+    Only one slab of about chunk_size elements is loaded at a time, and
+    the scan stops at the first slab holding an invalid element.
+
+    Parameters
+    ----------
+    x: np.ndarray.
+        The array to scan, possibly memory mapped.
+    invalid: callable.
+        Vectorized test, giving the mask of the invalid elements in a slab.
+    chunk_size: int.
+        The number of elements loaded at once.
+
+    Returns
+    -------
+    out: tuple.
+        The index of the first invalid element, None if there's none.
+    """
+    __array = x.reshape(1) if x.ndim == 0 else x
+    __rows = max(1, chunk_size // max(1, int(np.prod(__array.shape[1:]))))
+
+    for __start in range(0, __array.shape[0], __rows):
+        __mask = invalid(__array[__start:__start + __rows])
+        if __mask.any():
+            __index = np.unravel_index(int(np.argmax(__mask)), __mask.shape)
+            __index = (__start + int(__index[0]),) + tuple(map(int, __index[1:]))
+            return __index[:x.ndim]
+
+    return None
+
+@trusted
+def find_nonnumeric(x, chunk_size: int = _CHUNK_SIZE) -> one_of(tuple, nothing):
+    """
+    Locates the first non numeric element of a large array, or .npy file.
+
+    The array is scanned by chunks, so that memory mapped arrays are
+    never loaded entirely ; numeric dtypes are answered without reading
+    any element.
+
+    Parameters
+    ----------
+    x: str, os.PathLike or np.ndarray.
+        The array, or the path to a .npy file.
+    chunk_size: int.
+        The number of elements loaded at once.
+
+    Returns
+    -------
+    out: tuple.
+        The index of the first non numeric element, None if they're all
+        numeric.
+    """
+    __array = _load(x)
+
+    if __array.dtype.kind in _REAL_KINDS or __array.size == 0:
+        return None
+    elif __array.dtype.kind in _NONNUMERIC_KINDS:
+        return (0,) * __array.ndim
+
+    return _first_invalid(
+        __array,
+        lambda __slab: ~np.vectorize(_numeric_scalar, otypes=[bool])(__slab),
+        chunk_size)
+
+@trusted
+def find_nonfinite(x, chunk_size: int = _CHUNK_SIZE) -> one_of(tuple, nothing):
+    """
+    Locates the first non finite element of a large array, or .npy file.
+
+    The array is scanned by chunks with vectorized reductions, so that
+    memory mapped arrays are never loaded entirely ; the scan stops at
+    the first chunk holding a non finite value.
+
+    Parameters
+    ----------
+    x: str, os.PathLike or np.ndarray.
+        The array, or the path to a .npy file.
+    chunk_size: int.
+        The number of elements loaded at once.
+
+    Returns
+    -------
+    out: tuple.
+        The index of the first non finite element, None if they're all
+        finite.
+    """
+    __array = _load(x)
+
+    if __array.dtype.kind in _FINITE_KINDS:
+        __invalid = lambda __slab: ~np.isfinite(__slab)
+    else:
+        __invalid = lambda __slab: ~np.vectorize(_finite_scalar, otypes=[bool])(__slab)
+
+    return _first_invalid(__array, __invalid, chunk_size)
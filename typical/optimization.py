@@ -8,17 +8,19 @@ Optimization Algorithms
 
 from __future__ import division, print_function, absolute_import
 
+import collections
 import numpy as np
 
-from .typical import checks
+from .typical import trusted
 
-from .numeric import finite, numeric
+from .numeric import _REAL_KINDS, _numeric_values, numeric
+from .parallel import all_slices, parallel
 
 #####################################################################
 # BOUNDS PREDICATES
 #####################################################################
 
-@checks
+@trusted
 def _check_bounds_tuple(x) -> bool:
     """
     Checks whether a tuple is a valid bound.
@@ -43,7 +45,7 @@ def _check_bounds_tuple(x) -> bool:
 
     return is_valid
 
-@checks
+@trusted
 def _check_bounds_dict(x) -> bool:
     """
     Checks whether a dict represents valid bounds.
@@ -67,11 +69,64 @@ def _check_bounds_dict(x) -> bool:
     
     return is_valid
 
-@checks
+def _bounds_shaped(x) -> bool:
+    """
+    Checks whether an argument is an array of (lower, upper) rows.
+
+    Parameters
+    ----------
+    x:
+        The argument to check.
+
+    Returns
+    -------
+    out: bool.
+        True if the argument is a np.ndarray of shape (n, 2).
+    """
+    return (
+        isinstance(x, np.ndarray)
+        and len(x.shape) == 2
+        and x.shape[1] == 2)
+
+@trusted
+def find_invalid_bounds(x) -> np.ndarray:
+    """
+    Locates the invalid rows of a bounds array, for diagnostics.
+
+    Parameters
+    ----------
+    x: np.ndarray.
+        An array of shape (n, 2), holding (lower, upper) rows.
+
+    Returns
+    -------
+    out: np.ndarray.
+        The indices of the rows which are not valid bounds.
+    """
+    if not _bounds_shaped(x):
+        raise ValueError(
+            "'find_invalid_bounds' expects an array of shape (n, 2), "
+            "got {}".format(repr(getattr(x, 'shape', type(x)))))
+
+    if x.dtype.kind in _REAL_KINDS:
+        return np.flatnonzero(~(x[:, 0] <= x[:, 1]))
+
+    return np.array(
+        [
+            __i
+            for __i, __line in enumerate(x)
+            if not _check_bounds_tuple(tuple(__line))],
+        dtype=np.intp)
+
+@trusted
 def _check_bounds_array(x) -> bool:
     """
     Checks whether a np.ndarray represents valid bounds.
 
+    Numeric arrays are checked with a few vectorized operations, split
+    across threads above the threshold set by `parallelize` ; the other
+    dtypes are checked row by row.
+
     Parameters
     ----------
     x: np.ndarray.
@@ -82,17 +137,16 @@ def _check_bounds_array(x) -> bool:
     out: bool.
         True if the argument is valid bounds.
     """
-    is_valid = (
-        isinstance(x, np.ndarray)
-        and len(x.shape) == 2
-        and x.shape[1] == 2
-        and all(map(
-            lambda t: _check_bounds_tuple(x=t),
-            [tuple(line) for line in x])))
-
-    return is_valid
+    if not _bounds_shaped(x):
+        return False
+    elif x.dtype.kind not in _REAL_KINDS:
+        return find_invalid_bounds(x).size == 0
+    elif parallel(x.size):
+        return all_slices(x, lambda __slice: (__slice[:, 0] <= __slice[:, 1]).all())
+    else:
+        return bool((x[:, 0] <= x[:, 1]).all())
 
-@checks
+@trusted
 def bounds(x) -> bool:
     """
     Checks whether an argument represents valid bounds.
@@ -120,7 +174,88 @@ def bounds(x) -> bool:
 # SPECIFICATIONS PREDICATES
 #####################################################################
 
-@checks
+Specifications = collections.namedtuple(
+    'Specifications',
+    ['names', 'lower', 'upper'])
+
+_PARSED = {}        # id of a specifications dict => (items, parsed)
+
+_PARSED_SIZE = 8    # number of specifications dicts remembered
+
+@trusted
+def parse_specifications(x) -> Specifications:
+    """
+    Validates specifications and packs them into arrays, in a single pass.
+
+    The result is cached : parsing the same, unchanged dict again only
+    compares its items with the previous ones. Parsing the result itself
+    is free, so downstream code can pass it around instead of the dict.
+
+    Parameters
+    ----------
+    x: dict or Specifications.
+        The bounds of each parameter, as {name: (lower, upper)}.
+
+    Returns
+    -------
+    out: Specifications.
+        The parameter names, and the read-only 'lower' and 'upper'
+        arrays of bounds, in the same order.
+    """
+    if isinstance(x, Specifications):
+        return x
+    elif not isinstance(x, dict) or not x:
+        raise ValueError(
+            "'parse_specifications' expects a non empty dict, "
+            "got {}".format(repr(type(x))))
+
+    __items = tuple(x.items())
+    __cached = _PARSED.get(id(x))
+
+    if __cached is not None and __cached[0] == __items:
+        return __cached[1]
+
+    for __name, __value in __items:
+        if not (isinstance(__value, tuple) and len(__value) == 2):
+            raise ValueError(
+                "'{}' expects a (lower, upper) tuple, "
+                "got {}".format(__name, repr(__value)))
+
+    if not _numeric_values([__bound for __name, __value in __items for __bound in __value]):
+        __name, __value = next(
+            (__name, __value)
+            for __name, __value in __items
+            if not _numeric_values(__value))
+        raise ValueError(
+            "'{}' expects numeric bounds, "
+            "got {}".format(__name, repr(__value)))
+
+    __bounds = np.array([__value for __name, __value in __items], dtype=np.float64)
+    __invalid = ~(np.isfinite(__bounds).all(axis=1) & (__bounds[:, 0] <= __bounds[:, 1]))
+
+    if __invalid.any():
+        __name, __value = __items[int(np.argmax(__invalid))]
+        raise ValueError(
+            "'{}' expects finite bounds, with lower <= upper, "
+            "got {}".format(__name, repr(__value)))
+
+    __bounds.flags.writeable = False
+
+    __parsed = Specifications(
+        names=tuple(x),
+        lower=__bounds[:, 0],
+        upper=__bounds[:, 1])
+
+    if len(_PARSED) >= _PARSED_SIZE:
+        try:
+            del _PARSED[next(iter(_PARSED))]
+        except (KeyError, RuntimeError, StopIteration):
+            pass # evicted by another thread
+    _PARSED[id(x)] = (__items, __parsed)
+
+    return __parsed
+
+@trusted
 def specifications(x) -> bool:
     """
     Checks whether an argument represents valid specifications.
@@ -135,8 +270,14 @@ def specifications(x) -> bool:
     out: bool.
         True if the argument is valid specifications.
     """
-    return (
-        isinstance(x, dict)
-        and bounds(x)
-        and all([finite(v[0]) for k, v in x.items()])
-        and all([finite(v[1]) for k, v in x.items()]))
+    if isinstance(x, Specifications):
+        return True
+    elif not isinstance(x, dict):
+        return False
+
+    try:
+        parse_specifications(x)
+    except (ValueError, TypeError):
+        return False
+    else:
+        return True
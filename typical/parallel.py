@@ -0,0 +1,176 @@
+# -*- coding: utf-8 -*-
+
+"""
+===================
+Parallel Reductions
+===================
+
+Splits the validation of very large arrays across a pool of threads.
+
+The numpy reductions like `np.isfinite` and the comparisons release the
+GIL, so the slices of an array are actually checked in parallel. The
+parallel mode is off until `parallelize` sets a size threshold ; see also
+the TYPICAL_PARALLEL_THRESHOLD environment variable.
+
+Examples
+--------
+    >>> parallelize(threshold=2 ** 22, workers=32)
+    >>> finite(np.random.rand(10 ** 8))
+    True
+"""
+
+from __future__ import division, print_function, absolute_import
+
+import concurrent.futures
+import os
+import threading
+
+import numpy as np
+
+#####################################################################
+# SETTINGS
+#####################################################################
+
+_LOCK = threading.Lock()
+
+def _parse_threshold(value: str) -> int:
+    """
+    Parses the TYPICAL_PARALLEL_THRESHOLD environment variable.
+
+    Parameters
+    ----------
+    value: str.
+        The content of the environment variable.
+
+    Returns
+    -------
+    out: int.
+        The threshold, None when it's not set or not a positive integer.
+    """
+    try:
+        return max(int(value.strip()), 0) or None
+    except ValueError:
+        return None
+
+_SETTINGS = {
+    'threshold': _parse_threshold(os.environ.get('TYPICAL_PARALLEL_THRESHOLD', '')),
+    'workers': None,
+    'executor': None}
+
+def parallelize(threshold: int = 2 ** 22, workers: int = None):
+    """
+    Validates the arrays above a given size across a pool of threads.
+
+    Parameters
+    ----------
+    threshold: int.
+        The number of elements from which the arrays are split, None to
+        turn the parallel mode off.
+    workers: int.
+        The number of threads, the number of CPUs by default.
+    """
+    with _LOCK:
+        if _SETTINGS['executor'] is not None and workers != _SETTINGS['workers']:
+            _SETTINGS['executor'].shutdown(wait=False)
+            _SETTINGS['executor'] = None
+        _SETTINGS['threshold'] = threshold
+        _SETTINGS['workers'] = workers
+
+def _executor() -> concurrent.futures.ThreadPoolExecutor:
+    """
+    Gives the pool of threads, created on first use ; to be called under
+    the lock, so that `parallelize` can't shut it down before the tasks
+    are submitted.
+
+    Returns
+    -------
+    out: concurrent.futures.ThreadPoolExecutor.
+        The shared pool.
+    """
+    if _SETTINGS['executor'] is None:
+        _SETTINGS['executor'] = concurrent.futures.ThreadPoolExecutor(
+            max_workers=_SETTINGS['workers'] or os.cpu_count(),
+            thread_name_prefix='typical')
+    return _SETTINGS['executor']
+
+#####################################################################
+# REDUCTIONS
+#####################################################################
+
+def parallel(size: int) -> bool:
+    """
+    Tells whether an array is large enough to be checked in parallel.
+
+    Parameters
+    ----------
+    size: int.
+        The number of elements of the array.
+
+    Returns
+    -------
+    out: bool.
+        True if the parallel mode is on and the array is above the
+        threshold.
+    """
+    __threshold = _SETTINGS['threshold']
+    return __threshold is not None and size >= __threshold
+
+def flat(x: np.ndarray) -> np.ndarray:
+    """
+    Flattens an array without copying it, when its memory is contiguous.
+
+    Parameters
+    ----------
+    x: np.ndarray.
+        The array to split.
+
+    Returns
+    -------
+    out: np.ndarray.
+        A flat view on the array, or the array itself.
+    """
+    if x.flags.c_contiguous or x.flags.f_contiguous:
+        return x.ravel(order='K')
+    return x
+
+def all_slices(x: np.ndarray, test: callable) -> bool:
+    """
+    Checks the slices of an array along its first axis, in parallel.
+
+    The array is split in more slices than there are threads, and the
+    slices still waiting for a thread are cancelled as soon as one fails.
+
+    Parameters
+    ----------
+    x: np.ndarray.
+        The array to check.
+    test: callable.
+        Checks a slice, returning a bool.
+
+    Returns
+    -------
+    out: bool.
+        True if all the slices pass the test.
+    """
+    __count = min(len(x), 4 * (_SETTINGS['workers'] or os.cpu_count())) or 1
+    __failed = threading.Event()
+
+    def __test(__slice):
+        return __failed.is_set() or bool(test(__slice))
+
+    __slices = np.array_split(x, __count)
+
+    with _LOCK:
+        __executor = _executor()
+        __futures = [__executor.submit(__test, __slice) for __slice in __slices]
+
+    try:
+        for __future in concurrent.futures.as_completed(__futures):
+            if not __future.result():
+                __failed.set()
+                return False
+    finally:
+        for __future in __futures:
+            __future.cancel()
+
+    return True
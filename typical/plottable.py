@@ -8,19 +8,63 @@ Plottable Predicates
 
 from __future__ import division, print_function, absolute_import
 
+import numpy as np
+
 from .generic import iterable
-from .numeric import finite
-from .typical import checks
+from .numeric import _FINITE_KINDS, finite
+from .typical import trusted
 
 #####################################################################
 # TRACE & CHARTS PREDICATES
 #####################################################################
 
-@checks
+def _column(x) -> int:
+    """
+    Checks whether an argument is a column of graphing data.
+
+    Arrays and buffers, like `array.array` or `memoryview`, are checked
+    with a single vectorized reduction, without copying them ; the other
+    iterables are converted when they hold numbers only, and walked
+    otherwise.
+
+    Parameters
+    ----------
+    x:
+        The argument to check.
+
+    Returns
+    -------
+    out: int.
+        The length of the column, 0 if it's empty or invalid.
+    """
+    if not iterable(x):
+        return 0                # scalars, 0-d arrays
+    elif isinstance(x, np.ndarray):
+        __array = x
+    else:
+        try:
+            __array = np.asarray(memoryview(x))
+        except TypeError:
+            try:
+                __array = np.asarray(x)
+            except (TypeError, ValueError):
+                __array = None
+
+    if (
+            __array is not None
+            and __array.ndim >= 1
+            and __array.dtype.kind in _FINITE_KINDS):
+        return len(__array) if len(__array) and finite(__array) else 0
+
+    return len(x) if len(x) and all(map(finite, x)) else 0
+
+@trusted
 def trace_data(x) -> bool:
     """
     Checks whether an argument contains graphing data.
 
+    The 'x' and 'y' columns can be lists, arrays or any buffer.
+
     Parameters
     ----------
     x:
@@ -31,17 +75,13 @@ def trace_data(x) -> bool:
     out: bool.
         True if the argument is valid data for a trace.
     """
-    return (
-        isinstance(x, dict)
-        and (
-            'x' in x.keys()
-            and iterable(x.get('x'))
-            and bool(x.get('x'))
-            and all(map(finite, x.get('x'))))
-        and (
-            'y' in x.keys()
-            and iterable(x.get('y'))
-            and bool(x.get('y'))
-            and all(map(finite, x.get('y'))))
-        and len(x.get('x')) == len(x.get('y'))
-        and 'name' in x.keys())
+    if not (
+            isinstance(x, dict)
+            and 'x' in x.keys()
+            and 'y' in x.keys()
+            and 'name' in x.keys()):
+        return False
+
+    __length = _column(x.get('x'))
+
+    return __length > 0 and __length == _column(x.get('y'))
@@ -0,0 +1,165 @@
+# -*- coding: utf-8 -*-
+
+"""
+=========
+Profiling
+=========
+
+Counters recording the cost of the checks, for each decorated function :
+the number of calls, the time spent checking the arguments, running the
+body and checking the result, and the failures of each checker.
+
+Each thread accumulates in its own counters, so the hot path never takes
+a lock ; the counters of all the threads are summed when taking a
+snapshot. The counters of the finished threads are folded into a total
+per function, so that short-lived threads don't pile up.
+"""
+
+from __future__ import division, print_function, absolute_import
+
+import collections
+import threading
+import weakref
+
+#####################################################################
+# COUNTERS
+#####################################################################
+
+_CALLS, _ARGUMENTS, _BODY, _RESULT, _FAILURES = range(5)
+
+_LOCK = threading.Lock()
+
+_COUNTERS = {}  # function name => [counters of the finished threads, [(thread, counters)]]
+
+def _zeros() -> list:
+    """
+    Creates a blank set of counters.
+
+    Returns
+    -------
+    out: list.
+        The number of calls, the seconds spent in the argument checks,
+        the body and the result check, and the failures per checker.
+    """
+    return [0, 0., 0., 0., collections.Counter()]
+
+def _alive(thread: weakref.ref) -> bool:
+    """
+    Tells whether a thread is still running.
+
+    Parameters
+    ----------
+    thread: weakref.ref.
+        A reference to the thread.
+
+    Returns
+    -------
+    out: bool.
+    """
+    __thread = thread()
+    return __thread is not None and __thread.is_alive()
+
+def _fold(entry: list) -> list:
+    """
+    Adds the counters of the finished threads to the total of a function,
+    and forgets them ; to be called under the lock.
+
+    Parameters
+    ----------
+    entry: list.
+        The total of the function, and the counters of its threads.
+
+    Returns
+    -------
+    out: list.
+        The total first, then the counters of the running threads.
+    """
+    __total, __threads = entry
+    __running = []
+
+    for __thread, __counters in __threads:
+        if _alive(__thread):
+            __running.append((__thread, __counters))
+        else:
+            __total[:_FAILURES] = [
+                __sum + __value
+                for __sum, __value in zip(__total[:_FAILURES], __counters[:_FAILURES])]
+            __total[_FAILURES].update(__counters[_FAILURES])
+
+    __threads[:] = __running
+
+    return [__total] + [__counters for __thread, __counters in __running]
+
+def counters(name: str) -> callable:
+    """
+    Allocates the counters of a function.
+
+    Parameters
+    ----------
+    name: str.
+        The qualified name of the function.
+
+    Returns
+    -------
+    out: callable.
+        Gives the counters of the current thread, which are registered
+        on their first use.
+    """
+    __local = threading.local()
+
+    def __counters() -> list:
+        try:
+            return __local.counters
+        except AttributeError:
+            __local.counters = _zeros()
+            with _LOCK:
+                __entry = _COUNTERS.setdefault(name, [_zeros(), []])
+                _fold(__entry)
+                __entry[1].append((
+                    weakref.ref(threading.current_thread()),
+                    __local.counters))
+            return __local.counters
+
+    return __counters
+
+#####################################################################
+# REPORT
+#####################################################################
+
+def stats() -> dict:
+    """
+    Takes a snapshot of the counters of all the profiled functions.
+
+    Returns
+    -------
+    out: dict.
+        For each function name, the number of calls, the seconds spent
+        in the 'arguments' checks, the 'body' and the 'result' check, and
+        the number of 'failures' per parameter.
+    """
+    __snapshot = {}
+
+    with _LOCK:
+        for __name, __entry in _COUNTERS.items():
+            __threads = _fold(__entry)
+            __failures = collections.Counter()
+            for __counters in __threads:
+                __failures.update(__counters[_FAILURES])
+            __snapshot[__name] = {
+                'calls': sum(__c[_CALLS] for __c in __threads),
+                'arguments': sum(__c[_ARGUMENTS] for __c in __threads),
+                'body': sum(__c[_BODY] for __c in __threads),
+                'result': sum(__c[_RESULT] for __c in __threads),
+                'failures': dict(__failures)}
+
+    return __snapshot
+
+def reset_stats():
+    """
+    Sets all the counters back to zero.
+    """
+    with _LOCK:
+        for __entry in _COUNTERS.values():
+            for __counters in _fold(__entry):
+                __counters[:_FAILURES] = _zeros()[:_FAILURES]
+                __counters[_FAILURES].clear()
@@ -0,0 +1,188 @@
+# -*- coding: utf-8 -*-
+
+"""
+=========
+Reporting
+=========
+
+Policies reporting the failed checks : raise a TypeError, emit a
+`TypeWarning`, or log a warning.
+
+In the 'warn' and 'log' modes, the decorated functions carry on. Each
+failure is reported once per function, parameter and type of the culprit
+value, and the reports are rate limited by a token bucket : a hot path
+going bad doesn't flood the output. The messages are only formatted when
+a report is actually emitted.
+
+The policy can also be set with the TYPICAL_POLICY environment variable.
+
+Examples
+--------
+    >>> on_failure('log', rate=1., burst=10)
+"""
+
+from __future__ import division, print_function, absolute_import
+
+import logging
+import os
+import sys
+import threading
+import time
+import warnings
+
+#####################################################################
+# SETTINGS
+#####################################################################
+
+_POLICIES = ('raise', 'warn', 'log')
+
+_PACKAGE = os.path.dirname(os.path.abspath(__file__)) + os.sep   # not the siblings, like 'typical_utils'
+
+_LOCK = threading.Lock()
+
+def _parse_policy(value: str) -> str:
+    """
+    Parses the TYPICAL_POLICY environment variable.
+
+    Parameters
+    ----------
+    value: str.
+        The content of the environment variable.
+
+    Returns
+    -------
+    out: str.
+        The policy, 'raise' when it's not set or unknown.
+    """
+    value = value.strip().lower()
+    return value if value in _POLICIES else 'raise'
+
+_SETTINGS = {
+    'policy': _parse_policy(os.environ.get('TYPICAL_POLICY', '')),
+    'rate': 1.,
+    'burst': 10,
+    'logger': logging.getLogger('typical')}
+
+_BUCKET = [10., time.monotonic()]   # tokens left, time of the last refill
+
+_REPORTED = {}                      # (function, parameter, type) => None
+_REPORTED_SIZE = 4096
+
+class TypeWarning(UserWarning):
+    """
+    Warns about an argument or a result failing its check.
+    """
+
+def on_failure(
+        policy: str = 'raise',
+        rate: float = 1.,
+        burst: int = 10,
+        logger: logging.Logger = None):
+    """
+    Sets how the failed checks are reported.
+
+    Parameters
+    ----------
+    policy: str.
+        'raise' a TypeError, 'warn' with a `TypeWarning` or 'log' a
+        warning ; in the last two modes, the functions run anyway.
+    rate: float.
+        The number of reports emitted per second in the long run, None
+        for no limit.
+    burst: int.
+        The number of reports that can be emitted at once.
+    logger: logging.Logger.
+        The logger of the 'log' mode, the 'typical' logger by default.
+    """
+    if policy not in _POLICIES:
+        raise ValueError("'on_failure' expects a policy among {}, got {!r}".format(_POLICIES, policy))
+
+    with _LOCK:
+        _SETTINGS['policy'] = policy
+        _SETTINGS['rate'] = rate
+        _SETTINGS['burst'] = burst
+        _SETTINGS['logger'] = logger or logging.getLogger('typical')
+        _BUCKET[:] = [burst, time.monotonic()]
+        _REPORTED.clear()
+
+#####################################################################
+# REPORT
+#####################################################################
+
+def _take() -> bool:
+    """
+    Takes a token from the bucket, which refills at the given rate ;
+    to be called under the lock.
+
+    Returns
+    -------
+    out: bool.
+        True if a report can be emitted.
+    """
+    if _SETTINGS['rate'] is None:
+        return True
+
+    __now = time.monotonic()
+    __tokens = min(
+        _SETTINGS['burst'],
+        _BUCKET[0] + (__now - _BUCKET[1]) * _SETTINGS['rate'])
+
+    if __tokens < 1.:
+        _BUCKET[:] = [__tokens, __now]
+        return False
+
+    _BUCKET[:] = [__tokens - 1., __now]
+    return True
+
+def _stacklevel() -> int:
+    """
+    Finds the first frame outside of the package and of the generated
+    wrappers, so that the warnings point at the faulty call.
+
+    Returns
+    -------
+    out: int.
+        The stack level, relative to the caller.
+    """
+    __level = 1
+    __frame = sys._getframe(1)
+
+    while __frame is not None and (
+            __frame.f_code.co_filename.startswith(_PACKAGE)
+            or __frame.f_code.co_filename.startswith('<checks ')):
+        __frame = __frame.f_back
+        __level += 1
+
+    return __level
+
+def report(key: tuple, message: callable):
+    """
+    Reports a failed check, following the current policy.
+
+    Parameters
+    ----------
+    key: tuple.
+        The function, the parameter and the type of the culprit value ;
+        each key is reported once in the 'warn' and 'log' modes.
+    message: callable.
+        Formats the message, only called when the report is emitted.
+    """
+    __policy = _SETTINGS['policy']
+
+    if __policy == 'raise':
+        raise TypeError(message())
+
+    if key in _REPORTED:
+        return
+
+    with _LOCK:
+        if key in _REPORTED or not _take():
+            return
+        if len(_REPORTED) >= _REPORTED_SIZE:
+            del _REPORTED[next(iter(_REPORTED))]
+        _REPORTED[key] = None
+
+    if __policy == 'warn':
+        warnings.warn(message(), TypeWarning, stacklevel=_stacklevel())
+    else:
+        _SETTINGS['logger'].warning(message())
@@ -0,0 +1,95 @@
+# -*- coding: utf-8 -*-
+
+"""
+=================
+Sampling Policies
+=================
+
+Policies deciding which calls of a checked function are validated.
+
+A policy is a callable without arguments, returning True when the
+current call should be checked. The counters rely on `itertools.count`,
+whose increments are atomic : the policies are thread-safe without
+taking a lock on each call.
+
+Examples
+--------
+    >>> @checks(sample=one_in(1000))
+    ... def hot(x: int) -> int:
+    ...     return 2 * x
+"""
+
+from __future__ import division, print_function, absolute_import
+
+import itertools
+import random
+import threading
+import time
+
+#####################################################################
+# POLICIES
+#####################################################################
+
+def one_in(n: int, seed: int = None) -> callable:
+    """
+    Validates one call out of n.
+
+    The phase of the counter is drawn at random, so that the call
+    sites sharing the same rate are not all checked on the same call ;
+    give a seed to make it deterministic.
+
+    Parameters
+    ----------
+    n: int.
+        The sampling period, 1 to check every call.
+    seed: int.
+        The seed of the phase, None for a random one.
+
+    Returns
+    -------
+    out: callable.
+        The sampling policy.
+    """
+    if n < 1:
+        raise ValueError("'one_in' expects a period of at least 1, got {}".format(n))
+
+    __counter = itertools.count(random.Random(seed).randrange(n))
+
+    def __one_in() -> bool:
+        return next(__counter) % n == 0
+
+    return __one_in
+
+def per_second(k: int, clock: callable = time.monotonic) -> callable:
+    """
+    Validates at most k calls per second.
+
+    The budget is renewed at the start of each second, as given by the
+    clock.
+
+    Parameters
+    ----------
+    k: int.
+        The maximum number of checked calls per second.
+    clock: callable.
+        Gives the current time in seconds.
+
+    Returns
+    -------
+    out: callable.
+        The sampling policy.
+    """
+    __lock = threading.Lock()
+    __window = [(int(clock()), itertools.count())]
+
+    def __per_second() -> bool:
+        __now = int(clock())
+        __start, __counter = __window[0]
+        if __now != __start:
+            with __lock:
+                if __window[0][0] != __now:
+                    __window[0] = (__now, itertools.count())
+                __start, __counter = __window[0]
+        return next(__counter) < k
+
+    return __per_second
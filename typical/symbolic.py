@@ -8,18 +8,52 @@ Maths Symbols
 
 from __future__ import division, print_function, absolute_import
 
+import numbers
+
 import numpy as np
 import sympy as smp
 
 from .generic import iterable
-from .numeric import numeric
-from .typical import checks
+from .numeric import _NUMERIC_TYPES, _REAL_KINDS, numeric
+from .typical import trusted, type_only
+
+#####################################################################
+# TYPE CLASSIFICATION
+#####################################################################
+
+_SYMBOLIC_BASES = (numbers.Real, np.bool_, smp.Expr)
+
+_SYMBOLIC_TYPES = {}        # type => whether all its instances qualify
+_SYMBOLIC_TYPES_SIZE = 256  # sympy creates classes on the fly, like Function('f')
+
+def _symbolic_type(t: type) -> bool:
+    """
+    Checks whether all the instances of a type are symbolic, caching the
+    verdict for each type.
+
+    Parameters
+    ----------
+    t: type.
+        The type of an element.
+
+    Returns
+    -------
+    out: bool.
+        True if all the instances qualify, False if it depends on the value.
+    """
+    try:
+        return _SYMBOLIC_TYPES[t]
+    except KeyError:
+        __verdict = issubclass(t, _SYMBOLIC_BASES)
+        if len(_SYMBOLIC_TYPES) < _SYMBOLIC_TYPES_SIZE:
+            _SYMBOLIC_TYPES[t] = __verdict
+        return __verdict
 
 #####################################################################
 # SYMBOLIC PREDICATES
 #####################################################################
 
-@checks
+@trusted
 def _symbolic_scalar(x) -> bool:
     """
     Checks whether the input is a symbolic expression ; any class
@@ -35,9 +69,10 @@ def _symbolic_scalar(x) -> bool:
     out: bool.
         True if the argument is a symbolic expression.
     """
-    return numeric(x) or isinstance(x, smp.Expr)
+    return _symbolic_type(type(x)) or numeric(x)
 
-@checks
+@trusted
+@type_only(*_NUMERIC_TYPES, smp.Expr)
 def symbolic(x) -> bool:
     """
     Checks whether the input is a symbolic expression ; any class
@@ -45,6 +80,8 @@ def symbolic(x) -> bool:
 
     ! NOTE !
     Works on iterables.
+    Arrays with a numeric dtype pass right away ; the elements of the
+    other arrays are classified by type, each type being resolved once.
 
     Parameters
     ----------
@@ -61,6 +98,8 @@ def symbolic(x) -> bool:
             _symbolic_scalar,
             x.values())))
     elif isinstance(x, np.ndarray):
+        if x.dtype.kind in _REAL_KINDS:
+            return True
         return bool(all(map(
             _symbolic_scalar,
             x.flat)))
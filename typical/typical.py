@@ -8,8 +8,16 @@ Checking processes
 
 from __future__ import division, print_function, absolute_import
 
-from decorator import decorator
+import functools
 import inspect
+import os
+import time
+import weakref
+
+from .hints import _DEPTH, _ELEMENTS, compile_hint, is_hint
+from .profiling import _ARGUMENTS, _BODY, _CALLS, _FAILURES, _RESULT, counters
+from .reporting import report
+from .sampling import one_in
 
 #####################################################################
 # MESSAGES
@@ -68,49 +76,1019 @@ def _check(arg, checker):
     elif callable(checker):
         return checker(arg)                 #predicates
     else:
-        return True   
+        return True
+
+#####################################################################
+# COMPILATION
+#####################################################################
+
+_EMPTY = inspect.Parameter.empty
+
+def _compile_checker(checker, depth: int = _DEPTH, elements: int = _ELEMENTS):
+    """
+    Turns an annotation into a predicate, once and for all.
+
+    The type-vs-callable branching of `_check` is resolved here, at
+    decoration time, rather than on every call. The type hints, like
+    `list[int]` or `Optional[float]`, are compiled by `compile_hint`.
+
+    Parameters
+    ----------
+    checker: type or callable.
+        The annotation of a parameter or of the return value.
+    depth: int.
+        The levels of nested containers whose elements are checked.
+    elements: int.
+        The number of elements checked in each container.
+
+    Returns
+    -------
+    out: callable or None.
+        A predicate on the argument value, None if there's nothing
+        to check.
+    """
+    if type(checker) == type:
+        return lambda __arg: isinstance(__arg, checker)     #types
+    elif is_hint(checker):
+        return compile_hint(checker, depth, elements)       #type hints
+    elif callable(checker):
+        return checker                                      #predicates
+    else:
+        return None
 
-@decorator
-def checks(func, *args, **kwargs):
+def _compile_signature(func, depth: int = _DEPTH, elements: int = _ELEMENTS):
+    """
+    Reads the signature and the annotations of a function, once.
+
+    Parameters
+    ----------
+    func: callable.
+        The function to decorate.
+    depth: int.
+        The levels of nested containers whose elements are checked.
+    elements: int.
+        The number of elements checked in each container.
+
+    Returns
+    -------
+    out: tuple.
+        The named argument checkers, as (name, annotation, predicate)
+        tuples ; the checkers of the extra positional and keyword
+        arguments, as (name, annotation, predicate) tuples or None ; and
+        the return checker, as an (annotation, predicate) tuple or None.
+    """
+    __annotations = getattr(func, '__annotations__', None) or {}
+    __arg_spec = inspect.getfullargspec(func)
+
+    __arg_checkers = tuple(
+        (
+            __argname,
+            __annotations[__argname],
+            __predicate)
+        for __argname in __arg_spec.args + __arg_spec.kwonlyargs
+        if __argname in __annotations
+        for __predicate in (_compile_checker(__annotations[__argname], depth, elements),)
+        if __predicate is not None)
+
+    __varargs_checker = None
+    if __arg_spec.varargs in __annotations:
+        __predicate = _compile_checker(__annotations[__arg_spec.varargs], depth, elements)
+        if __predicate is not None:
+            __varargs_checker = (
+                '*' + __arg_spec.varargs,
+                __annotations[__arg_spec.varargs],
+                __predicate)
+
+    __varkw_checker = None
+    if __arg_spec.varkw in __annotations:
+        __predicate = _compile_checker(__annotations[__arg_spec.varkw], depth, elements)
+        if __predicate is not None:
+            __varkw_checker = (
+                '**' + __arg_spec.varkw,
+                __annotations[__arg_spec.varkw],
+                __predicate)
+
+    __return_checker = None
+    if 'return' in __annotations:
+        __predicate = _compile_checker(__annotations['return'], depth, elements)
+        if __predicate is not None:
+            __return_checker = (__annotations['return'], __predicate)
+
+    return __arg_checkers, __varargs_checker, __varkw_checker, __return_checker
+
+#####################################################################
+# SWITCH
+#####################################################################
+
+def _flag(value: str) -> bool:
+    """
+    Parses an on / off setting, as given in the environment.
+
+    Parameters
+    ----------
+    value: str.
+        A string like '1', 'on', 'true' or '0', 'off', 'false'.
+
+    Returns
+    -------
+    out: bool.
+        Whether the setting is on.
+    """
+    return value.strip().lower() not in ('', '0', 'false', 'off', 'no')
+
+def _parse_switches(value: str) -> dict:
+    """
+    Parses the TYPICAL_CHECKS environment variable.
+
+    It is a comma separated list of settings : a bare 'on' / 'off'
+    applies globally, while 'module=on' / 'module=off' applies to a
+    module and its submodules. For example 'off,myapp.api=on'.
+
+    Parameters
+    ----------
+    value: str.
+        The content of the environment variable.
+
+    Returns
+    -------
+    out: dict.
+        The state of the checks, for each module name ; the global
+        state is stored under the key None.
+    """
+    __switches = {None: True}
+
+    for __setting in value.split(','):
+        if '=' in __setting:
+            __module, __state = __setting.split('=', 1)
+            __switches[__module.strip()] = _flag(__state)
+        elif __setting.strip():
+            __switches[None] = _flag(__setting)
+
+    return __switches
+
+_SWITCHES = _parse_switches(os.environ.get('TYPICAL_CHECKS', ''))
+
+_CHECKED = weakref.WeakKeyDictionary()   # wrapper => (module, rebind)
+
+def is_enabled(module: str = None) -> bool:
+    """
+    Tells whether the checks are enabled for a given module.
+
+    The most specific setting wins : a module inherits the state of its
+    package, and ultimately the global state.
+
+    Parameters
+    ----------
+    module: str.
+        The name of a module, None for the global state.
+
+    Returns
+    -------
+    out: bool.
+        Whether the functions of this module are checked.
+    """
+    while module:
+        if module in _SWITCHES:
+            return _SWITCHES[module]
+        module = module.rpartition('.')[0]
+    return _SWITCHES[None]
+
+def _switch(module: str, state: bool):
+    """
+    Sets the state of the checks, and rebinds the affected wrappers.
+
+    Parameters
+    ----------
+    module: str.
+        The name of a module, None for the global state.
+    state: bool.
+        Whether to check the functions.
+    """
+    if module is None:
+        _SWITCHES.clear()
+    else:
+        for __module in list(_SWITCHES):
+            if __module and __module.startswith(module + '.'):
+                del _SWITCHES[__module]
+
+    _SWITCHES[module] = state
+
+    for __module, __rebind in list(_CHECKED.values()):
+        __rebind(is_enabled(__module))
+
+def enable(module: str = None):
+    """
+    Enables the checks, globally or for a given module and its submodules.
+
+    Parameters
+    ----------
+    module: str.
+        The name of a module, None for all the modules.
+    """
+    _switch(module, True)
+
+def disable(module: str = None):
+    """
+    Disables the checks, globally or for a given module and its submodules.
+
+    The wrappers then call the original functions straight away, without
+    testing any flag.
+
+    Parameters
+    ----------
+    module: str.
+        The name of a module, None for all the modules.
+    """
+    _switch(module, False)
+
+_PROFILING = _flag(os.environ.get('TYPICAL_PROFILE', ''))
+
+def profile(enabled: bool = True):
+    """
+    Turns the profiling of the checked functions on or off.
+
+    While it's on, the checked functions record their number of calls,
+    the time spent in the argument checks, the body and the result check,
+    and their failures per parameter ; see `typical.stats`. The calls
+    skipped by a sampling policy are not recorded.
+
+    Parameters
+    ----------
+    enabled: bool.
+        Whether to profile the checked functions.
+    """
+    global _PROFILING
+    _PROFILING = enabled
+
+    for __module, __rebind in list(_CHECKED.values()):
+        __rebind(is_enabled(__module))
+
+#####################################################################
+# INLINE CACHE
+#####################################################################
+
+def type_only(*types):
+    """
+    Marks a predicate whose verdict depends only on the type of its
+    argument, as long as this type derives from one of the given types.
+
+    The checked functions can then skip this predicate when the call
+    repeats the argument types of a previous, valid call.
+
+    Parameters
+    ----------
+    types: list.
+        The types for which the predicate only looks at the type ;
+        object covers all the values.
+
+    Returns
+    -------
+    out: callable.
+        A decorator, setting the `type_only` attribute of the predicate.
+    """
+    def __mark(func):
+        func.type_only = types
+        return func
+
+    return __mark
+
+def _type_only(annotation) -> tuple:
+    """
+    Finds the types on which a checker depends only on the type.
+
+    Parameters
+    ----------
+    annotation: type or callable.
+        The annotation of a parameter.
+
+    Returns
+    -------
+    out: tuple.
+        The types for which the checker verdict is type-determined.
+    """
+    if type(annotation) == type:
+        return (object,)
+    return getattr(annotation, 'type_only', ())
+
+def _cache(type_onlys: tuple, size: int) -> tuple:
+    """
+    Creates a small cache of the parameter types of the valid calls.
+
+    For each type signature, the cache records which checkers only depend
+    on the types of their arguments : the following calls with the same
+    types skip them. The oldest entry is evicted when the cache is full.
+
+    Parameters
+    ----------
+    type_onlys: tuple.
+        The types for which each cached checker is type-determined.
+    size: int.
+        The maximum number of type signatures remembered.
+
+    Returns
+    -------
+    out: tuple.
+        The cache, mapping the argument types to the checkers skipped,
+        and a function recording the types of a valid call.
+    """
+    __skips = {}
+
+    def __remember(key: tuple):
+        if len(__skips) >= size:
+            try:
+                del __skips[next(iter(__skips))]
+            except (KeyError, RuntimeError, StopIteration):
+                pass # evicted by another thread
+        __skips[key] = tuple(map(issubclass, key, type_onlys))
+
+    return __skips, __remember
+
+#####################################################################
+# STREAMING
+#####################################################################
+
+def _validated(values, predicate: callable, fail: callable):
+    """
+    Validates the elements of an iterable as they're consumed.
+
+    Parameters
+    ----------
+    values: iterable.
+        The argument or result to stream.
+    predicate: callable.
+        The checker of each element.
+    fail: callable.
+        Reports an invalid element, (index, element).
+
+    Returns
+    -------
+    out: iterator.
+        Yields the same elements, after checking each of them.
+    """
+    for __index, __element in enumerate(values):
+        if not predicate(__element):
+            fail(__index, __element)
+        yield __element
+
+#####################################################################
+# CODE GENERATION
+#####################################################################
+
+def _prefix(signature: inspect.Signature) -> str:
+    """
+    Picks a prefix for the generated names, so that they never shadow
+    the parameters of the function.
+
+    Parameters
+    ----------
+    signature: inspect.Signature.
+        The signature of the function.
+
+    Returns
+    -------
+    out: str.
+        The prefix of all the generated names.
+    """
+    __prefix = '_typical_'
+    while any(__name.startswith(__prefix) for __name in signature.parameters):
+        __prefix += '_'
+    return __prefix
+
+def _parameters(signature: inspect.Signature, prefix: str, values: dict) -> tuple:
+    """
+    Writes the parameter list of a function, and the arguments forwarding
+    them to the original function.
+
+    Parameters
+    ----------
+    signature: inspect.Signature.
+        The signature of the function.
+    prefix: str.
+        The prefix of the generated names.
+    values: dict.
+        The expressions forwarded in place of some parameters, by name.
+
+    Returns
+    -------
+    out: tuple.
+        The source of the parameter list, the source of the forwarded
+        arguments, and the default values by generated name.
+    """
+    __parameters, __arguments, __defaults = [], [], {}
+    __positional_only = 0
+    __keyword_only = False
+
+    for __parameter in signature.parameters.values():
+        __name = __parameter.name
+        __value = values.get(__name, __name)
+
+        if __parameter.kind == __parameter.VAR_POSITIONAL:
+            __parameters.append('*' + __name)
+            __arguments.append('*' + __value)
+            __keyword_only = True
+            continue
+        elif __parameter.kind == __parameter.VAR_KEYWORD:
+            __parameters.append('**' + __name)
+            __arguments.append('**' + __value)
+            continue
+        elif __parameter.kind == __parameter.KEYWORD_ONLY and not __keyword_only:
+            __parameters.append('*')
+            __keyword_only = True
+
+        if __parameter.default is _EMPTY:
+            __parameters.append(__name)
+        else:
+            __defaults[prefix + 'default_' + __name] = __parameter.default
+            __parameters.append('{}={}default_{}'.format(__name, prefix, __name))
+
+        if __parameter.kind == __parameter.KEYWORD_ONLY:
+            __arguments.append('{}={}'.format(__name, __value))
+        else:
+            __arguments.append(__value)
+
+        if __parameter.kind == __parameter.POSITIONAL_ONLY:
+            __positional_only = len(__parameters)
+
+    if __positional_only:
+        __parameters.insert(__positional_only, '/')
+
+    return ', '.join(__parameters), ', '.join(__arguments), __defaults
+
+def _compile(func: callable, name: str, parameters: str, lines: list, namespace: dict) -> callable:
+    """
+    Compiles a generated function, with the given namespace as globals.
+
+    The generated functions have no closure : all the variants of a
+    checked function share the same globals, so that the wrapper can
+    switch from one to another by swapping its code.
+
+    Parameters
+    ----------
+    func: callable.
+        The original function.
+    name: str.
+        The name of the generated function.
+    parameters: str.
+        The source of its parameter list, as written by `_parameters`.
+    lines: list.
+        The source of its body, line by line.
+    namespace: dict.
+        The globals of the generated code.
+
+    Returns
+    -------
+    out: callable.
+        The compiled function, removed from the namespace.
+    """
+    __source = '\n'.join(
+        ['def {}({}):'.format(name, parameters)]
+        + ['    ' + __line for __line in lines])
+
+    exec(compile(__source, '<checks {}>'.format(func.__qualname__), 'exec'), namespace)
+    __compiled = namespace.pop(name)
+    __compiled.__name__ = func.__name__
+    __compiled.__qualname__ = func.__qualname__
+    __compiled.source = __source
+
+    return __compiled
+
+def _generate(
+        func: callable,
+        signature: inspect.Signature,
+        checkers: tuple,
+        fail: callable,
+        cache: int,
+        fail_fast: bool,
+        profiled: callable,
+        namespace: dict,
+        name: str,
+        depth: int = _DEPTH,
+        elements: int = _ELEMENTS) -> callable:
+    """
+    Writes the checked variant of a function, specialized for its
+    signature, and compiles it.
+
+    The generated function takes the same parameters as the original,
+    so the interpreter binds the arguments ; the type annotations are
+    inlined as `isinstance` tests, and the predicates are bound as
+    globals of the generated code. There's no loop, except on the extra
+    positional and keyword arguments.
+
+    Parameters
+    ----------
+    func: callable.
+        The original function.
+    signature: inspect.Signature.
+        Its signature.
+    checkers: tuple.
+        The argument, extra arguments and return checkers, as compiled by
+        `_compile_signature`.
+    fail: callable.
+        Reports a failed check, (argname, expected, culprit type,
+        description of the culprit, flag) ; it may return, when the
+        failures are only warned about.
+    cache: int.
+        The size of the cache of valid argument types, 0 to disable it.
+    fail_fast: bool.
+        Whether to check the arguments before running the function.
+    profiled: callable.
+        Gives the counters recording the cost of the checks, None to
+        leave them out.
+    namespace: dict.
+        The globals of the generated code, shared by all the variants of
+        the function.
+    name: str.
+        The name of the generated function in the namespace.
+    depth: int.
+        The levels of nested containers whose elements are checked, for
+        the elements of the streams.
+    elements: int.
+        The number of elements checked in each container.
+
+    Returns
+    -------
+    out: callable.
+        The checked function.
+    """
+    __arg_checkers, __varargs_checker, __varkw_checker, __return_checker = checkers
+    __p = _prefix(signature)
+    __namespace = namespace
+    __namespace.update({
+        __p + 'func': func,
+        __p + 'validated': _validated,
+        __p + 'isinstance': isinstance,
+        __p + 'type': type})
+    __values = {}
+
+    def __test(value: str, annotation, predicate: callable, key: str) -> str:
+        if type(annotation) == type or hasattr(predicate, '_isinstance'):
+            __namespace[__p + 'type_' + key] = getattr(predicate, '_isinstance', annotation)
+            return '{0}isinstance({1}, {0}type_{2})'.format(__p, value, key)
+        __namespace[__p + 'check_' + key] = predicate
+        return '{}check_{}({})'.format(__p, key, value)
+
+    def __failure(argname: str, expected: str, flag: int) -> callable:
+        def __fail_on(value, name=argname):
+            fail(
+                argname,
+                expected,
+                type(value),
+                lambda: '{}={}'.format(name, repr(type(value))),
+                flag)
+        return __fail_on
+
+    def __failure_on_shape(argname: str, expected: str, flag: int) -> callable:
+        __shape = '{}.shape={{}}'.format(argname) if flag == 0 else 'of shape {}'
+        def __fail_on(value, name, size):
+            fail(
+                argname,
+                expected,
+                type(value),
+                lambda: (__shape + ', where {}={}').format(value.shape, name, size),
+                flag)
+        return __fail_on
+
+    __bound = {}    # dimension name => source of its size, from the first axis bearing it
+
+    def __bind(value: str, argname: str, annotation, flag: int, key: str) -> list:
+        __lines = []
+        for __axis, __name in getattr(annotation, 'dimensions', ()):
+            __size = '{}.shape[{}]'.format(value, __axis)
+            if __name not in __bound:
+                __bound[__name] = __size
+                continue
+            __namespace[__p + 'fail_shape_' + key] = __failure_on_shape(
+                argname,
+                '{}:{}'.format(argname, annotation) if flag == 0 else '{}'.format(annotation),
+                flag)
+            __lines += [
+                'if {} != {}:'.format(__size, __bound[__name]),
+                '    {}fail_shape_{}({}, {!r}, {})'.format(__p, key, value, __name, __bound[__name])]
+        return __lines
+
+    def __failure_on_element(argname: str, expected: str, flag: int) -> callable:
+        def __fail_on(index, element):
+            fail(
+                argname,
+                expected,
+                type(element),
+                lambda: '{}[{}]={}'.format(argname, index, repr(type(element))),
+                flag)
+        return __fail_on
+
+    # arguments
+
+    __cached = [
+        __i
+        for __i, __checker in enumerate(__arg_checkers)
+        if type(__checker[1]) != type and _type_only(__checker[1])] if cache else []
+    __arguments = []
+
+    if __cached:
+        __namespace[__p + 'skips'], __namespace[__p + 'remember'] = _cache(
+            tuple(_type_only(__arg_checkers[__i][1]) for __i in __cached),
+            cache)
+        __namespace[__p + 'unseen'] = (False,) * len(__cached)
+        __arguments += [
+            '{}key = ({},)'.format(__p, ', '.join(
+                '{}type({})'.format(__p, __arg_checkers[__i][0]) for __i in __cached)),
+            '{0}skip = {0}skips.get({0}key, {0}unseen)'.format(__p)]
+
+    __arguments.append('{}failed = False'.format(__p))
+
+    for __i, (__argname, __annotation, __predicate) in enumerate(__arg_checkers):
+        __key = str(__i)
+        __expected = '{}:{}'.format(__argname, __annotation)
+        __namespace[__p + 'fail_' + __key] = __failure(__argname, __expected, 0)
+        __condition = 'not {}'.format(__test(__argname, __annotation, __predicate, __key))
+        if __i in __cached:
+            __condition = 'not {}skip[{}] and {}'.format(__p, __cached.index(__i), __condition)
+        __arguments += [
+            'if {}:'.format(__condition),
+            '    {}fail_{}({})'.format(__p, __key, __argname),
+            '    {}failed = True'.format(__p)]
+
+        if hasattr(__annotation, 'element'):
+            __element = _compile_checker(__annotation.element, depth, elements)
+            if __element is not None:
+                __namespace[__p + 'element_' + __key] = __element
+                __namespace[__p + 'fail_element_' + __key] = __failure_on_element(
+                    __argname, __expected, 0)
+                __values[__argname] = '{0}validated({1}, {0}element_{2}, {0}fail_element_{2})'.format(
+                    __p, __argname, __key)
+
+    if __cached:
+        __arguments += [
+            'if {0}skip is {0}unseen and not {0}failed:'.format(__p),
+            '    {0}remember({0}key)'.format(__p)]
+
+    __shapes = [
+        __line
+        for __i, (__argname, __annotation, __predicate) in enumerate(__arg_checkers)
+        for __line in __bind(__argname, __argname, __annotation, 0, str(__i))]
+
+    if __shapes:
+        __arguments += ['if not {}failed:'.format(__p)] + ['    ' + __line for __line in __shapes]
+
+    if __varargs_checker is not None:
+        __argname, __annotation, __predicate = __varargs_checker
+        __namespace[__p + 'fail_varargs'] = __failure(
+            __argname, '{}:{}'.format(__argname, __annotation), 0)
+        __arguments += [
+            'for {}value in {}:'.format(__p, __argname[1:]),
+            '    if not {}:'.format(__test(__p + 'value', __annotation, __predicate, 'varargs')),
+            '        {0}fail_varargs({0}value)'.format(__p)]
+
+    if __varkw_checker is not None:
+        __argname, __annotation, __predicate = __varkw_checker
+        __namespace[__p + 'fail_varkw'] = __failure(
+            __argname, '{}:{}'.format(__argname, __annotation), 0)
+        __arguments += [
+            'for {0}name, {0}value in {1}.items():'.format(__p, __argname[2:]),
+            '    if not {}:'.format(__test(__p + 'value', __annotation, __predicate, 'varkw')),
+            '        {0}fail_varkw({0}value, {0}name)'.format(__p)]
+
+    # body
+
+    __parameters, __forwarded, __defaults = _parameters(signature, __p, __values)
+    __namespace.update(__defaults)
+    __body = ['{0}result = {0}func({1})'.format(__p, __forwarded)]
+
+    # result
+
+    __result = []
+
+    if __return_checker is not None:
+        __annotation, __predicate = __return_checker
+        __expected = '{}'.format(__annotation)
+        __namespace[__p + 'fail_return'] = lambda __value: fail(
+            'return', __expected, type(__value), lambda: repr(type(__value)), 1)
+        __result += [
+            'if not {}:'.format(__test(__p + 'result', __annotation, __predicate, 'return')),
+            '    {0}fail_return({0}result)'.format(__p)]
+
+        __shapes = __bind(__p + 'result', 'return', __annotation, 1, 'return')
+        if __shapes:
+            __result += ['elif not {}failed:'.format(__p)] + ['    ' + __line for __line in __shapes]
+
+        if hasattr(__annotation, 'element'):
+            __element = _compile_checker(__annotation.element, depth, elements)
+            if __element is not None:
+                __namespace[__p + 'element_return'] = __element
+                __namespace[__p + 'fail_element_return'] = __failure_on_element(
+                    'return', __expected, 1)
+                __result.append(
+                    '{0}result = {0}validated({0}result, {0}element_return, {0}fail_element_return)'.format(__p))
+
+    # assembly
+
+    __sections = [(_ARGUMENTS, __arguments), (_BODY, __body), (_RESULT, __result)]
+    if not fail_fast:
+        __sections[:2] = __sections[1::-1]
+
+    __lines = []
+
+    if profiled is None:
+        for __slot, __section in __sections:
+            __lines += __section
+    else:
+        __namespace[__p + 'counters'] = profiled
+        __namespace[__p + 'clock'] = time.perf_counter
+        __lines += [
+            '{0}record = {0}counters()'.format(__p),
+            '{}record[{}] += 1'.format(__p, _CALLS),
+            '{0}start = {0}clock()'.format(__p)]
+        for __slot, __section in __sections:
+            __lines += ['try:'] + ['    ' + __line for __line in __section or ['pass']] + [
+                'finally:',
+                '    {0}stop = {0}clock()'.format(__p),
+                '    {0}record[{1}] += {0}stop - {0}start'.format(__p, __slot),
+                '    {0}start = {0}stop'.format(__p)]
+
+    __lines.append('return {}result'.format(__p))
+
+    return _compile(func, name, __parameters, __lines, __namespace)
+
+#####################################################################
+# SAMPLING
+#####################################################################
+
+def _sampled(
+        sample: callable,
+        checked: callable,
+        func: callable,
+        signature: inspect.Signature,
+        namespace: dict,
+        name: str) -> callable:
+    """
+    Checks only the calls picked by a sampling policy.
+
+    Parameters
+    ----------
+    sample: callable.
+        The sampling policy, telling whether to check the current call.
+    checked: callable.
+        The checked function.
+    func: callable.
+        The original function.
+    signature: inspect.Signature.
+        Its signature.
+    namespace: dict.
+        The globals of the generated code.
+    name: str.
+        The name of the generated function in the namespace.
+
+    Returns
+    -------
+    out: callable.
+        The sampled function.
+    """
+    __p = _prefix(signature)
+    __parameters, __forwarded, __defaults = _parameters(signature, __p, {})
+    namespace.update(__defaults)
+    namespace[__p + 'sample'] = sample
+    namespace[name + '_checked'] = checked
+
+    return _compile(func, name, __parameters, [
+        'if {}sample():'.format(__p),
+        '    return {}_checked({})'.format(name, __forwarded),
+        'return {}func({})'.format(__p, __forwarded)], namespace)
+
+#####################################################################
+# DECORATOR
+#####################################################################
+
+def checks(
+        func=None,
+        *,
+        fail_fast=True,
+        sample=None,
+        cache=None,
+        depth=_DEPTH,
+        elements=_ELEMENTS):
     """
     Function decorator. Checks decorated function is given valid arguments,
     following the information written in the annotations.
 
-    ! NOTE !
-    Only checking the varargs ; there's no information to check the kwargs.
+    The signature is inspected once, when the function is decorated ;
+    the checks are then compiled into a function specialized for this
+    signature, on the first call. The wrapper has the same parameters as
+    the function, and runs the code of the checked variant itself : the
+    arguments are never repacked. It carries the metadata of the
+    function, like `functools.wraps`, along with its `__signature__`.
+
+    By default, the arguments are validated before running the function
+    body, so that a rejected call doesn't pay for the computation.
+
+    The checks can be switched off and on at runtime, per module, with
+    `disable` and `enable` ; see also the TYPICAL_CHECKS environment
+    variable. Likewise, `profile` turns on the recording of their cost.
+
+    All the parameters are checked : the named ones whether they're given
+    by position or keyword, with their default values, and each of the
+    extra positional / keyword arguments against the annotation of
+    `*args` / `**kwargs`. The interpreter binds the arguments, as for the
+    original function.
+
+    The iterables annotated with `stream(checker)`, arguments or result,
+    are wrapped in iterators checking each element as it's consumed.
+
+    The arrays annotated with `array(shape=...)` must agree on the size
+    of the axes bearing the same name, like (n, d) and (n,), across the
+    arguments and the result.
 
     Parameters
     ----------
     func: callable.
         A function on which we want to enforce type checking.
+    fail_fast: bool.
+        Whether to check the arguments before running the function ;
+        otherwise they're checked along with the result, after the call.
+    sample: callable or int.
+        A sampling policy from `typical.sampling`, telling whether to
+        check the current call ; an int n is a shortcut for `one_in(n)`.
+        By default, all the calls are checked.
+    cache: int.
+        The size of the cache of valid argument types, 0 to disable it.
+        By default, the cache holds 8 type signatures and is only used
+        when some parameters are annotated with `type_only` predicates.
+    depth: int.
+        The levels of nested containers whose elements are checked, for
+        the type hints like `list[int]` ; None for all of them.
+    elements: int.
+        The number of elements checked in each container on every call,
+        picked at random in the sequences ; None for a full scan.
 
     Returns
     -------
     out: callable.
         The decorated function.
     """
-    __result = func(*args, **kwargs)
-
-    if hasattr(func, '__annotations__') and func.__annotations__:
-        __arg_spec = inspect.getfullargspec(func)
-
-        for __argname, __arg in zip(__arg_spec.args, args):
-            if __argname in func.__annotations__:
-                __checker = func.__annotations__[__argname]
-                if not _check(__arg, __checker):
-                    raise TypeError(function_arg_types_error(
-                        func.__name__,
-                        "{}:{}".format(__argname, __checker),
-                        "{}={}".format(__argname, repr(type(__arg))),
-                        0))
-
-        if 'return' in func.__annotations__:
-            __checker = func.__annotations__['return']
-            if not _check(__result, __checker):
-                raise TypeError(function_arg_types_error(
-                    func.__name__,
-                    "{}".format(__checker),
-                    repr(type(__result)),
-                    1))
-
-    return __result
+    if func is None:
+        return functools.partial(
+            checks,
+            fail_fast=fail_fast,
+            sample=sample,
+            cache=cache,
+            depth=depth,
+            elements=elements)
+
+    (
+        __arg_checkers,
+        __varargs_checker,
+        __varkw_checker,
+        __return_checker) = _compile_signature(func, depth, elements)
+
+    if not any((
+            __arg_checkers,
+            __varargs_checker,
+            __varkw_checker,
+            __return_checker)):
+        return func
+
+    __name = '{}.{}'.format(
+        getattr(func, '__module__', None),
+        getattr(func, '__qualname__', func.__name__))
+    __counters = counters(__name)
+
+    def __fail(argname, expected, culprit, describe, flag):
+        if _PROFILING:
+            __counters()[_FAILURES][argname] += 1
+        report(
+            (__name, argname, culprit),
+            lambda: function_arg_types_error(
+                func.__name__,
+                expected,
+                describe(),
+                flag))
+
+    if cache is None:
+        cache = 8 * any(
+            type(__checker[1]) != type and _type_only(__checker[1])
+            for __checker in __arg_checkers)
+
+    __signature = inspect.signature(func)
+    __checkers = (
+        __arg_checkers,
+        __varargs_checker,
+        __varkw_checker,
+        __return_checker)
+
+    __sample = None
+    if sample is not None:
+        __sample = one_in(sample) if isinstance(sample, int) else sample
+
+    __p = _prefix(__signature)
+    __parameters, __forwarded, __defaults = _parameters(__signature, __p, {})
+    __namespace = dict(__defaults)
+    __namespace[__p + 'func'] = func
+    __module = getattr(func, '__module__', None)
+
+    __variants = {}     # (enabled, profiled) => code of the wrapper, generated on first use
+
+    def __variant(enabled, profiled):
+        try:
+            return __variants[enabled, profiled]
+        except KeyError:
+            if not enabled:
+                __compiled = _compile(
+                    func,
+                    __p + 'unchecked',
+                    __parameters,
+                    ['return {}func({})'.format(__p, __forwarded)],
+                    __namespace)
+            else:
+                __name = __p + ('profiled' if profiled else 'checked')
+                __compiled = _generate(
+                    func,
+                    __signature,
+                    __checkers,
+                    __fail,
+                    cache,
+                    fail_fast,
+                    __counters if profiled else None,
+                    __namespace,
+                    __name,
+                    depth,
+                    elements)
+                if __sample is not None:
+                    __compiled = _sampled(
+                        __sample,
+                        __compiled,
+                        func,
+                        __signature,
+                        __namespace,
+                        __name + '_sampled')
+            return __variants.setdefault((enabled, profiled), __compiled.__code__)
+
+    def __generate():
+        __wrapper = __reference()
+        __wrapper.__code__ = __variant(is_enabled(__module), _PROFILING)
+        return __wrapper
+
+    __namespace[__p + 'generate'] = __generate
+
+    # the wrapper runs the code of the current variant : its first call
+    # generates the checks, then calls it again
+
+    __wrapper = _compile(
+        func,
+        __p + 'wrapper',
+        __parameters,
+        ['return {}generate()({})'.format(__p, __forwarded)],
+        __namespace)
+    __lazy = __wrapper.__code__
+    __reference = weakref.ref(__wrapper)
+
+    def __rebind(enabled):
+        __wrapper = __reference()
+        if __wrapper is None:
+            return
+        elif not enabled:
+            __wrapper.__code__ = __variant(False, False)
+        else:
+            __wrapper.__code__ = __variants.get((True, _PROFILING), __lazy)
+
+    __rebind(is_enabled(__module))
+
+    del __wrapper.source
+    functools.update_wrapper(__wrapper, func)
+    __wrapper.__signature__ = __signature
+    _CHECKED[__wrapper] = (__module, __rebind)
+
+    return __wrapper
+
+#####################################################################
+# TRUSTED PREDICATES
+#####################################################################
+
+_DEBUG = _flag(os.environ.get('TYPICAL_DEBUG', ''))
+
+def trusted(func):
+    """
+    Function decorator for the library's own predicates.
+
+    These are trusted to honor their annotations, so they run as plain
+    functions : calling a predicate from another costs a normal function
+    call. The checked variant is kept as the `checked` attribute, and
+    replaces the plain function when the TYPICAL_DEBUG environment
+    variable is set.
+
+    Parameters
+    ----------
+    func: callable.
+        A predicate, annotated like any function decorated with `checks`.
+
+    Returns
+    -------
+    out: callable.
+        The predicate itself, or its checked variant in debug mode.
+    """
+    __checked = checks(func)
+
+    if _DEBUG:
+        return __checked
+
+    func.checked = __checked
+
+    return func